@@ -57,6 +57,7 @@ from rhino.process import extend_gcode as rhext
 from rhino.process import draw_printbed as rhdrp
 from rhino.process import draw_gcode as rhdrg
 from rhino.process import import_robot as rhdrr
+from rhino.process import rhino_file as rhfil
 
 # REPORT
 from report import plot_gcode as repgc
@@ -472,49 +473,36 @@ def main():
     }
 
     print(f"[INFO] Checking robot kinematics for each point of the given G-Code\n")
-    status = []
-    total_points = len(gcode_necessary)
-
-    # Initialisierter Status (zeigt Fortschritt in 10%-Schritten an)
-    last_printed_progress = -10  # Starte bei -10 %, damit 0 % gleich angezeigt wird
-
-    for index, line in enumerate(gcode_necessary):
-        # Transform point in BASE to point in ROBOTROOT
-        point_base = [
-            line["X"],
-            line["Y"],
-            line["Z"],
-            1,
-        ]
-        point_robotroot = Transformation.invert(t_base_robotroot) @ point_base
-
-        # Set up homogeneous transformation Matrix
-        point_hom = np.eye(4)
-        point_hom[:3, :3] = r_robotroot_tool
-        point_hom[:3, 3] = point_robotroot[:3]
-
-        ik_point = robot.inverse_kinematics(hom_trans=point_hom)
-
-        if not ik_point:
-            src = False
-            reachable = False
-            line.update({"Reachable": False})
+
+    # Transform all points in BASE to points in ROBOTROOT
+    points_base = gcspf.points_to_xyz(gcode_necessary)
+    points_robotroot = Transformation.apply_many(
+        Transformation.invert(t_base_robotroot), points_base
+    )
+
+    # Set up homogeneous transformation Matrix of every point
+    points_hom = np.tile(np.eye(4), (len(points_base), 1, 1))
+    points_hom[:, :3, :3] = r_robotroot_tool
+    points_hom[:, :3, 3] = points_robotroot
+
+    ik_points = robot.calculate_inverse_kinematics(
+        hom_trans=points_hom, show_progress=True
+    )
+
+    _, ik_reachable = robot.solutions_to_array(ik_points)
+
+    for line, point_reachable in zip(gcode_necessary, ik_reachable.tolist()):
+        line["Reachable"] = point_reachable
+        if not point_reachable:
             print(
                 f"[ERROR] Point ({line['X']:.2f}, {line['Y']:.2f}, {line['Z']:.2f}) is not reachable"
             )
-        else:
-            line.update({"Reachable": True})
-
-        # Calculate Progress
-        progress = int((index + 1) / total_points * 100)
 
-        # Display progress every 10%
-        if progress // 10 > last_printed_progress // 10:
-            print(f"Progress: {progress}%")
-            last_printed_progress = progress
-
-    if all(entry.get("Reachable") is True for entry in gcode_necessary):
+    if ik_reachable.all():
         print("[INFO] All points from G-Code are reachable\n")
+    else:
+        src = False
+        reachable = False
 
     # Insert start and end point into the list
     gcode_necessary.insert(0, robot_start_point)
@@ -697,8 +685,10 @@ def main():
             os.remove(file_path)
 
     # ----------------RHINO FILE----------------
-    # Process G-Code for Rhino file
-    extended_gcode = rhext.add_point_info(points=gcode_necessary)
+    # Process G-Code for Rhino file (as structured array, shared by sublayer evaluation and drawing)
+    extended_gcode = rhext.add_point_info_array(
+        points=rhext.points_to_array(points=gcode_necessary)
+    )
 
     # Evaluate sub_sub Layers for the Layer "toolpath" inside the rhino file
     sublayers = rhevl.evaluate_sublayers_printbed(points_list=extended_gcode)
@@ -711,56 +701,57 @@ def main():
         sublayers=sublayers,
     )
 
-    # Import Robot.3dm file into Rhino
-    robot_file = Path(ROBOT_3DM_FILE)
-    if robot_file.exists() and robot_file.suffix.lower() == ".3dm":
-        # Position of Robotroot relative to printbed origin
-        robotroot_pos = [ROBOT_BASE["X"], ROBOT_BASE["Y"], ROBOT_BASE["Z"]]
-
-        rhdrr.import_step_file_to_rhino_file(
-            file_path=ROBOT_3DM_FILE,
-            target_point=robotroot_pos,
-            target_3dm_path=filepath,
-            target_layer_name="robot",
-        )
-    else:
-        print(
-            f"[ERROR] .3dm file for Robot does not exist under given filepath {ROBOT_3DM_FILE} or has the wrong format"
-        )
-        print(
-            "[WARNING] Skipping robot.3dm_file import from setup.json to Rhino file\n"
-        )
+    # Open Rhino file once for robot, printbed and toolpath; file is saved when leaving the block
+    with rhfil.open_rhino(filepath) as rhino_file:
+        if rhino_file is None:
+            exit(1)
+
+        # Import Robot.3dm file into Rhino
+        robot_file = Path(ROBOT_3DM_FILE)
+        if robot_file.exists() and robot_file.suffix.lower() == ".3dm":
+            # Position of Robotroot relative to printbed origin
+            robotroot_pos = [ROBOT_BASE["X"], ROBOT_BASE["Y"], ROBOT_BASE["Z"]]
+
+            rhdrr.import_robot(
+                file_path=ROBOT_3DM_FILE,
+                target_point=robotroot_pos,
+                rhino_file=rhino_file,
+                target_layer_name="robot",
+            )
+        else:
+            print(
+                f"[ERROR] .3dm file for Robot does not exist under given filepath {ROBOT_3DM_FILE} or has the wrong format"
+            )
+            print(
+                "[WARNING] Skipping robot.3dm_file import from setup.json to Rhino file\n"
+            )
 
-    # Generate printbed in Rhino
-    printbed = rhdrp.add_print_bed(
-        file_path=filepath,
-        x_max=BED_SIZE["X"],
-        y_max=BED_SIZE["Y"],
-        parent_layer="printbed",
-    )
+        # Generate printbed in Rhino
+        printbed = rhdrp.create_print_bed(
+            rhino_file=rhino_file,
+            x_max=BED_SIZE["X"],
+            y_max=BED_SIZE["Y"],
+            parent_layer="printbed",
+        )
 
-    if printbed:
-        print("[INFO] printbed successfully created in Rhino file")
-    else:
-        print("[ERROR] printbed creation failed")
-        exit(1)
-
-    # Generate toolpath in Rhino
-    toolpath = rhdrg.create_geometry(
-        points=extended_gcode,
-        filepath=filepath,
-        linetype_dict=RHINO_LINE_STYLE_LINE,
-        line_color_dict=RHINO_LINE_TYPES_COLOR,
-        line_widths=RHINO_LINE_WIDTH,
-        point_color=RHINO_POINT_COLORS,
-        point_print=RHINO_POINT_PRINT,
-        precision=precision,
-    )
-    if toolpath:
-        print("[INFO] toolpath successfully created in Rhino file")
-    else:
-        print("[ERROR] toolpath creation failed")
-        exit(1)
+        if printbed:
+            print("[INFO] printbed successfully created in Rhino file")
+        else:
+            print("[ERROR] printbed creation failed")
+            exit(1)
+
+        # Generate toolpath in Rhino
+        rhdrg.create_toolpath(
+            points=extended_gcode,
+            rhino_file=rhino_file,
+            linetype_dict=RHINO_LINE_STYLE_LINE,
+            line_color_dict=RHINO_LINE_TYPES_COLOR,
+            line_widths=RHINO_LINE_WIDTH,
+            point_color=RHINO_POINT_COLORS,
+            point_print=RHINO_POINT_PRINT,
+            precision=precision,
+        )
+    print("[INFO] toolpath successfully created in Rhino file")
 
     elapsed_seconds = time.time() - start_time
     minutes, seconds = divmod(int(elapsed_seconds), 60)
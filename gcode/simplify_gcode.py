@@ -1,6 +1,11 @@
 import re
+from operator import itemgetter
 from typing import List, Dict, Union
 
+import numpy as np
+
+_get_xyz = itemgetter("X", "Y", "Z")
+
 
 def translate_type(
     line_type_name: str, slicer: str, line_type_dict: Dict[str, list[str]]
@@ -158,3 +163,19 @@ def simplify_gcode(
             processed_gcode.append(gcode_entry)
 
     return processed_gcode
+
+
+def points_to_xyz(
+    points: List[Dict[str, Union[str, float, int, None]]] | np.ndarray,
+) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Collects the coordinates of all points in one contiguous array, so following steps can work on arrays.
+
+    :param points: list of dicts with at least the keys "X", "Y" and "Z" (or an array of coordinates [nx3])
+
+    :return: array of coordinates [nx3]
+    """
+    if isinstance(points, np.ndarray):
+        return np.ascontiguousarray(points, dtype=float).reshape(-1, 3)
+    return np.array(list(map(_get_xyz, points)), dtype=float).reshape(-1, 3)
@@ -1,12 +1,18 @@
-def evaluate_sublayers_printbed(points_list: list[dict]) -> dict[int, int]:
+import numpy as np
+
+
+def evaluate_sublayers_printbed(points_list: list[dict] | np.ndarray) -> dict[int, int]:
     """
     DESCRIPTION:
     Evaluates how many line-sublayers are needed per print layer.
 
-    :param points_list: List of dictionaries with keys 'Layer' and 'Line'.
+    :param points_list: List of dictionaries with keys 'Layer' and 'Line' (or structured array, see rhino.process.extend_gcode.POINT_DTYPE).
 
     :return: Dictionary mapping Layer -> max number of sublayers needed (line count).
     """
+    if isinstance(points_list, np.ndarray):
+        return _evaluate_sublayers_array(points_list)
+
     layer_line_counts = {}
 
     for point in points_list:
@@ -22,6 +28,26 @@ def evaluate_sublayers_printbed(points_list: list[dict]) -> dict[int, int]:
     return {layer: max_line for layer, max_line in layer_line_counts.items()}
 
 
+def _evaluate_sublayers_array(points: np.ndarray) -> dict[int, int]:
+    """
+    DESCRIPTION:
+    Same as evaluate_sublayers_printbed for points given as numpy structured array.
+    Layers keep the order of their first appearance.
+
+    :param points: structured array with fields 'Layer' and 'Line'
+
+    :return: Dictionary mapping Layer -> max number of sublayers needed (line count).
+    """
+    layers, first_index, inverse = np.unique(
+        points["Layer"], return_index=True, return_inverse=True
+    )
+    max_lines = np.full(len(layers), np.iinfo(points["Line"].dtype).min)
+    np.maximum.at(max_lines, inverse, points["Line"])
+
+    order = np.argsort(first_index)
+    return dict(zip(layers[order].tolist(), max_lines[order].tolist()))
+
+
 if __name__ == "__main__":
     # Beispielhafte Punktdaten zur Simulation
     test_points = [
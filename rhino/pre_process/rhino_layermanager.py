@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=None)
 def layer_structure(layer_max: int) -> dict[str, dict[str, Any]]:
     """
     DESCRIPTION:
@@ -10,7 +12,7 @@ def layer_structure(layer_max: int) -> dict[str, dict[str, Any]]:
 
     :param layer_max: maximum layer number for print
 
-    :return: dictionary defining the Rhino layer structure
+    :return: dictionary defining the Rhino layer structure (cached per layer_max, don't modify)
     """
     return {
         "toolpath": {
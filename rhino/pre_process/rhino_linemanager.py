@@ -1,14 +1,23 @@
-def linetype_patterns():
+from types import MappingProxyType
+
+# Custom linetypes (read-only): line defined as tuple of segments
+# (float [mm] defining the length of segment, bool defining if visible [True] or not [False])
+LINETYPE_PATTERNS = MappingProxyType(
+    {
+        "solid": ((10.0, True),),
+        "dashed": ((10.0, False), (5.0, True), (10.0, False)),
+        "dotted": ((2.0, False), (2.0, True)),
+        "dash_dot": ((10.0, False), (5.0, True), (2.0, False), (5.0, True)),
+    }
+)
+
+
+def linetype_patterns() -> MappingProxyType:
     """
     DESCRIPTION:
     Function to store custom linetypes
 
-    :return: Dictionary of custom linetypes;
-    line defined as list of segments (float [mm] defining the length of segment, bool defining if visible [True] or not [False]),
+    :return: read-only mapping of custom linetypes (LINETYPE_PATTERNS);
+    line defined as tuple of segments (float [mm] defining the length of segment, bool defining if visible [True] or not [False]),
     """
-    return {
-        "solid": [(10.0, True)],
-        "dashed": [(10.0, False), (5.0, True), (10.0, False)],
-        "dotted": [(2.0, False), (2.0, True)],
-        "dash_dot": [(10.0, False), (5.0, True), (2.0, False), (5.0, True)],
-    }
+    return LINETYPE_PATTERNS
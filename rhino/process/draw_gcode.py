@@ -1,5 +1,6 @@
 from pathlib import Path
 from matplotlib.colors import to_rgb
+import numpy as np
 
 import rhinoinside
 
@@ -12,6 +13,10 @@ import Rhino.FileIO as Rfi
 
 import System as Sys
 from System.Drawing import Color
+from System.Collections.Generic import List as NetList
+
+from rhino.process.line_runs import get_columns, get_segment_runs, zero_pad_id
+from rhino.process.rhino_file import open_rhino
 
 
 def color_name_to_rgb(color_name: str) -> tuple:
@@ -30,7 +35,7 @@ def color_name_to_rgb(color_name: str) -> tuple:
 
 
 def create_geometry(
-    points: list[dict],
+    points: list[dict] | np.ndarray,
     filepath: Path,
     linetype_dict: dict[str, str],
     line_color_dict: dict[str, str],
@@ -38,12 +43,14 @@ def create_geometry(
     point_color: dict[str, str],
     point_print: bool,
     precision: int,
+    verbose: bool = False,
 ):
     """
     DESCRIPTION:
     Creates geometry in a Rhino file: polylines and colored points.
+    Opens and saves the file; use create_toolpath to draw into an already opened file.
 
-    :param points: List of points.
+    :param points: List of points (or structured array, see rhino.process.extend_gcode.POINT_DTYPE)
     :param filepath: Path to the Rhino file.
     :param linetype_dict: Dictionary of line types from setup.Rhino.line_style_line.json
     :param line_color_dict: Dictionary of color names from setup.Rhino.line_types_color.json
@@ -51,37 +58,81 @@ def create_geometry(
     :param point_color: Dictionary of color names from setup.Rhino.point_color.json
     :param point_print: Bool if all points in should be visible in the Rhino file (if False only start, stop, retract, protract, end, beginning ar visible)
     :param precision: Precision of values displayed in Attribute User Text Strings.
+    :param verbose: If True every added line and point is printed to the console
 
     :return: bool if file was written successfully
     """
-    # Load the existing Rhino file
-    rhino_file = Rfi.File3dm.Read(str(filepath))
-    if rhino_file is None:
-        print(f"Error: Could not open the Rhino file at {filepath}.")
-        return False
+    with open_rhino(filepath) as rhino_file:
+        if rhino_file is None:
+            return False
+
+        create_toolpath(
+            points,
+            rhino_file,
+            linetype_dict,
+            line_color_dict,
+            line_widths,
+            point_color,
+            point_print,
+            precision,
+            verbose,
+        )
+
+    return True
+
+
+def create_toolpath(
+    points: list[dict] | np.ndarray,
+    rhino_file: Rfi.File3dm,
+    linetype_dict: dict[str, str],
+    line_color_dict: dict[str, str],
+    line_widths: dict[str, float],
+    point_color: dict[str, str],
+    point_print: bool,
+    precision: int,
+    verbose: bool = False,
+) -> None:
+    """
+    DESCRIPTION:
+    Creates geometry in an opened Rhino file: polylines and colored points.
+
+    :param points: List of points (or structured array, see rhino.process.extend_gcode.POINT_DTYPE)
+    :param rhino_file: Rhino file
+    :param linetype_dict: Dictionary of line types from setup.Rhino.line_style_line.json
+    :param line_color_dict: Dictionary of color names from setup.Rhino.line_types_color.json
+    :param line_widths: Dictionary of line widths from setup.Rhino.line_width.json
+    :param point_color: Dictionary of color names from setup.Rhino.point_color.json
+    :param point_print: Bool if all points in should be visible in the Rhino file (if False only start, stop, retract, protract, end, beginning ar visible)
+    :param precision: Precision of values displayed in Attribute User Text Strings.
+    :param verbose: If True every added line and point is printed to the console
+    """
+    layer_indices = get_layer_indices(rhino_file)
 
     print("[INFO] Creating lines...")
     create_lines(
-        points, rhino_file, linetype_dict, line_color_dict, line_widths, precision
+        points,
+        rhino_file,
+        linetype_dict,
+        line_color_dict,
+        line_widths,
+        precision,
+        verbose,
+        layer_indices,
     )
 
     print("[INFO] Creating points...")
-    create_points(points, rhino_file, point_color, point_print)
-
-    # Save the updated file
-    rhino_file.Write(str(filepath), 8)
-    print(f"[INFO] Updated Rhino file saved to {filepath}.\n")
-    return True
+    create_points(points, rhino_file, point_color, point_print, verbose, layer_indices)
 
 
-def get_layer_index(rhino_file: Rfi.File3dm, layer_id: str, line_id: str) -> int | None:
+def get_layer_indices(rhino_file: Rfi.File3dm) -> dict[tuple[str, str], int]:
     """
     DESCRIPTION:
-    Finds the layer index for a line with the name line_id inside layer_id in parent layer toolpath
+    Collects the layer indices of all line layers inside the layers of parent layer toolpath,
+    so the layer of every segment and point can be looked up without searching the layer table.
+
+    :param rhino_file: Rhino file
 
-    param rhino_file: Rhino file
-    param layer_id: Layer ID
-    param line_id: Line ID
+    :return: Dictionary of layer index for (layer_id, line_id) e.g. ('0003', '0127')
     """
     # 1. Get 'toolpath'
     toolpath_layer = next(
@@ -94,194 +145,245 @@ def get_layer_index(rhino_file: Rfi.File3dm, layer_id: str, line_id: str) -> int
     )
     if not toolpath_layer:
         print("[ERROR] 'toolpath'-Layer not found.\n")
-        return None
+        return {}
 
-    # 2. Get Layer e.g. '0003'
-    layer_obj = next(
-        (
-            l
-            for l in rhino_file.Layers
-            if l.Name == layer_id and l.ParentLayerId == toolpath_layer.Id
-        ),
-        None,
-    )
-    if not layer_obj:
-        print(f"[ERROR] Layer '{layer_id}' under 'toolpath' wasn't found.\n")
-        return None
-
-    # 3. Get Line-Layer e.g. '0127'
-    line_layer = next(
-        (
-            l
-            for l in rhino_file.Layers
-            if l.Name == line_id and l.ParentLayerId == layer_obj.Id
-        ),
-        None,
-    )
-    if not line_layer:
-        print(f"[ERROR] Line '{line_id}' under '{layer_id}' wasn't found.\n")
-        return None
+    # 2. Get Layers e.g. '0003'
+    layer_names = {
+        l.Id: l.Name for l in rhino_file.Layers if l.ParentLayerId == toolpath_layer.Id
+    }
 
-    return line_layer.Index
+    # 3. Get Line-Layers e.g. '0127'
+    return {
+        (layer_names[l.ParentLayerId], l.Name): l.Index
+        for l in rhino_file.Layers
+        if l.ParentLayerId in layer_names
+    }
 
 
 def create_lines(
-    points: list[dict],
+    points: list[dict] | np.ndarray,
     rhino_file: Rfi.File3dm,
     linetype_dict: dict[str, str],
     line_color_dict: dict[str, str],
     line_widths: dict[str, float],
     precision: int,
+    verbose: bool = False,
+    layer_indices: dict[tuple[str, str], int] | None = None,
 ) -> None:
     """
     DESCRIPTION:
-    Creates line segments from pairs of points. For some type changes a travel line is created
+    Creates line segments from pairs of points. For some type changes a travel line is created.
+    Consecutive segments of a line with identical attributes are added as one polyline
+    (Example: Segment 0001/0002/0010-0042), single segments are added as line (Example: Segment 0001/0002/0123).
 
     :param rhino_file: Rhino file
-    :param points: List of points.
+    :param points: List of points (or structured array, see rhino.process.extend_gcode.POINT_DTYPE)
     :param linetype_dict: Dictionary of line types from setup.Rhino.line_types_line.json
     :param line_color_dict: Dictionary of color names from setup.Rhino.line_types_color.json
     :param line_widths: Dictionary of line widths from setup.Rhino.line_width.json
     :param precision: Precision of values displayed in Attribute User Text Strings.
+    :param verbose: If True every added line segment is printed to the console
+    :param layer_indices: Layer indices from get_layer_indices (collected from rhino_file if None)
     """
+    if layer_indices is None:
+        layer_indices = get_layer_indices(rhino_file)
+
+    added = 0
+    # Layers and linetypes already reported as missing (one warning each)
+    missing_layers = set()
+    missing_linetypes = set()
+    # Object attribute templates per (type, visual type)
+    templates = {}
+
+    xs, ys, zs, layers, lines = get_columns(points, ("X", "Y", "Z", "Layer", "Line"))
+
+    # Runs of consecutive segments of a line sharing the same attributes
+    for start, end, first_segment, last_segment, key in get_segment_runs(
+        points, linetype_dict, line_widths, precision
+    ):
+        # Segment Id consisting of Layer/Line/Segment (Example: Segment 0001/0002/0123)
+        layer_id = zero_pad_id(layers[start])
+        line_id = zero_pad_id(lines[start])
 
-    # no new line created if type transitions within blocked
-    blocked = {
-        ("travel", "retract"),
-        ("retract", "travel"),
-        ("travel", "protract"),
-        ("protract", "travel"),
-        ("retract", "protract"),
-        ("protract", "retract"),
-    }
+        # Get layer to save line segments to
+        layer_index = layer_indices.get((layer_id, line_id))
+        if layer_index is None:
+            if (layer_id, line_id) not in missing_layers:
+                missing_layers.add((layer_id, line_id))
+                print(
+                    f"[WARNING] Layer {layer_id}/{line_id}  not found; Skipping line\n"
+                )
+            continue
+
+        forced_type, visual_type, user_strings, plot_weight = key
+
+        # Object attributes from template of this type (color, linetype)
+        template = templates.get((forced_type, visual_type))
+        if template is None:
+            template = create_line_template(
+                rhino_file,
+                forced_type,
+                visual_type,
+                linetype_dict,
+                line_color_dict,
+                missing_linetypes,
+            )
+            templates[(forced_type, visual_type)] = template
 
-    prev_layer = None
-    prev_line = None
-    segment_index = 0
+        attr = template.Duplicate()
+        attr.LayerIndex = layer_index
+        for user_key, user_value in user_strings:
+            attr.SetUserString(user_key, user_value)
+        attr.PlotWeight = float(plot_weight)
 
-    # iterate over points till second to last
-    for i in range(len(points) - 1):
-        p0 = points[i]
-        p1 = points[i + 1]
+        run_points = [Rg.Point3d(xs[k], ys[k], zs[k]) for k in range(start, end)]
+        added += add_segment_run(
+            rhino_file,
+            run_points,
+            attr,
+            zero_pad_id(first_segment),
+            zero_pad_id(last_segment),
+            verbose,
+        )
 
-        if p0["Layer"] != p1["Layer"] or p0["Line"] != p1["Line"]:
-            continue
+    print(f"[INFO] Added {added} line segments")
 
-        # Segment Id consisting of Layer/Line/Segment (Example: Segment 0001/0002/0123)
-        layer_id = f"{p1['Layer']:04d}"
-        line_id = f"{p1['Line']:04d}"
 
-        # Reset Segment Id counter
-        if layer_id != prev_layer or line_id != prev_line:
-            segment_index = 0
+def create_line_template(
+    rhino_file: Rfi.File3dm,
+    forced_type: str,
+    visual_type: str,
+    linetype_dict: dict[str, str],
+    line_color_dict: dict[str, str],
+    missing_linetypes: set[str],
+) -> Rdo.ObjectAttributes:
+    """
+    DESCRIPTION:
+    Creates the object attributes shared by all segments of a type (color, linetype and sources for the print view).
+    Layer, user strings, plot weight and name are set per segment run.
 
-        segment_id = f"{segment_index:04d}"
-        segment_index += 1
+    :param rhino_file: Rhino file
+    :param forced_type: Type displayed in Attribute User Text
+    :param visual_type: Type used for color and linetype (retract and protract are displayed as travel)
+    :param linetype_dict: Dictionary of line types from setup.Rhino.line_types_line.json
+    :param line_color_dict: Dictionary of color names from setup.Rhino.line_types_color.json
+    :param missing_linetypes: linetypes already reported as missing
 
-        prev_layer = layer_id
-        prev_line = line_id
+    :return: object attributes template
+    """
+    attr = Rdo.ObjectAttributes()
+    attr.SetUserString("Type", forced_type)
+
+    # Set linetype
+    color_hex = line_color_dict.get(visual_type, "#9B4468D")
+    linetype_name = linetype_dict.get(visual_type, "Continuous")
+
+    # PRINT VIEW
+    # Color
+    color_rgb = Color.FromArgb(*color_name_to_rgb(color_hex))
+    attr.ObjectColor = color_rgb
+    attr.ColorSource = Rdo.ObjectColorSource.ColorFromObject
+    attr.PlotColorSource = Rdo.ObjectPlotColorSource.PlotColorFromObject
+    attr.PlotColor = attr.ObjectColor
+    attr.PlotWeightSource = Rdo.ObjectPlotWeightSource.PlotWeightFromObject
+
+    # Try to find stated linetype in rhino file. Else use Continuous
+    linetype_index = next(
+        (
+            lt.Index
+            for lt in rhino_file.AllLinetypes
+            if lt.Name.lower() == linetype_name.lower()
+        ),
+        None,
+    )
+    if linetype_index is not None:
+        attr.LinetypeSource = Rdo.ObjectLinetypeSource.LinetypeFromObject
+        attr.LinetypeIndex = linetype_index
+    elif linetype_name not in missing_linetypes:
+        missing_linetypes.add(linetype_name)
+        print(
+            f"[WARNING] Linientyp '{linetype_name}' not found, using 'Continuous' as default\n"
+        )
 
-        # Check for change in Type
-        # Plot retract and protract as travel
-        type_pair = (p0["Type"], p1["Type"])
-        if type_pair in blocked:
-            visual_type = "travel"
-            forced_type = "travel"
-        else:
-            visual_type = (
-                "travel" if p1["Type"] in {"retract", "protract"} else p1["Type"]
-            )
-            forced_type = p1["Type"]
+    return attr
 
-        # Geometrie
-        start = Rg.Point3d(p0["X"], p0["Y"], p0["Z"])
-        end = Rg.Point3d(p1["X"], p1["Y"], p1["Z"])
-        line = Rg.Line(start, end)
 
-        # Get layer to save line segment to
-        layer_id = f"{p1['Layer']:04d}"
-        line_id = f"{p1['Line']:04d}"
-        layer_index = get_layer_index(rhino_file, layer_id, line_id)
-        if layer_index is None:
-            print(f"[WARNING] Layer {layer_id}/{line_id}  not found; Skipping line\n")
-            continue
+def add_segment_run(
+    rhino_file: Rfi.File3dm,
+    run_points: list[Rg.Point3d],
+    attr: Rdo.ObjectAttributes,
+    first_id: str,
+    last_id: str,
+    verbose: bool = False,
+) -> int:
+    """
+    DESCRIPTION:
+    Adds a run of consecutive segments with identical attributes to the Rhino file,
+    a single segment as line and several segments as one polyline.
 
-        # Object attributes
-        attr = Rdo.ObjectAttributes()
-        attr.LayerIndex = layer_index
-        attr.Name = f"Segment {layer_id}/{line_id}/{segment_id}"
-        attr.SetUserString("Layer", layer_id)
-        attr.SetUserString("Line", line_id)
-        attr.SetUserString("Type", forced_type)
-        attr.SetUserString(
-            "Extrusion", "1" if p1.get("Point_Info", "0") != "0" else "0"
-        )
-        attr.SetUserString("Linewidth [mm]", str(round(p1["Linewidth"], precision)))
-        attr.SetUserString("Flow [mm^3/s]", str(round(p1["Flow"], precision)))
-        attr.SetUserString("RPM [1/min]", str(round(p1["RPM"], precision)))
-        attr.SetUserString("Voltage [V]", str(round(p1["Voltage"], precision)))
-        attr.SetUserString("Velocity [m/s]", str(round(p1["Vel_CP_Max"], precision)))
-
-        # Set linetype
-        color_hex = line_color_dict.get(visual_type, "#9B4468D")
-        linetype_name = linetype_dict.get(visual_type, "Continuous")
-
-        # PRINT VIEW
-        # Color
-        color_rgb = Color.FromArgb(*color_name_to_rgb(color_hex))
-        attr.ObjectColor = color_rgb
-        attr.ColorSource = Rdo.ObjectColorSource.ColorFromObject
-        attr.PlotColorSource = Rdo.ObjectPlotColorSource.PlotColorFromObject
-        attr.PlotColor = attr.ObjectColor
+    :param rhino_file: Rhino file
+    :param run_points: Points of the run (number of segments + 1)
+    :param attr: Object attributes of the run (Name is set here)
+    :param first_id: Segment Id of the first segment in the run
+    :param last_id: Segment Id of the last segment in the run
+    :param verbose: If True the added run is printed to the console
 
-        # Linewidth for Print View determined either by Flow (Linewidth) for G1 or setup.Rhino.line_width.json
-        if p1["Move"] == "G1":
-            plot_weight = round(p1["Linewidth"], precision)
-        else:
-            plot_weight = line_widths.get(linetype_name.lower(), 0.5)
+    :return: number of segments added
+    """
+    layer_id = attr.GetUserString("Layer")
+    line_id = attr.GetUserString("Line")
 
-        attr.PlotWeightSource = Rdo.ObjectPlotWeightSource.PlotWeightFromObject
-        attr.PlotWeight = float(plot_weight)
+    if len(run_points) == 2:
+        attr.Name = f"Segment {layer_id}/{line_id}/{first_id}"
+        rhino_file.Objects.AddLine(Rg.Line(run_points[0], run_points[1]), attr)
+    else:
+        attr.Name = f"Segment {layer_id}/{line_id}/{first_id}-{last_id}"
+        polyline = Rg.PolylineCurve(NetList[Rg.Point3d](run_points))
+        rhino_file.Objects.AddCurve(polyline, attr)
 
-        # Try to find stated linetype in rhino file. Else use Continuous
-        linetype_index = next(
-            (
-                lt.Index
-                for lt in rhino_file.AllLinetypes
-                if lt.Name.lower() == linetype_name.lower()
-            ),
-            None,
-        )
-        if linetype_index is not None:
-            attr.LinetypeSource = Rdo.ObjectLinetypeSource.LinetypeFromObject
-            attr.LinetypeIndex = linetype_index
-        else:
-            print(
-                f"[WARNING] Linientyp '{linetype_name}' not found, using 'Continuous' as default\n"
-            )
+    if verbose:
+        print(f"    {attr.Name} added")
 
-        rhino_file.Objects.AddLine(line, attr)
-        print(f"    Line {layer_id}/{line_id}/{segment_id} added")
+    return len(run_points) - 1
 
 
 def create_points(
-    points: list[dict],
+    points: list[dict] | np.ndarray,
     rhino_file: Rfi.File3dm,
     point_color: dict[str, str],
     point_print: bool,
+    verbose: bool = False,
+    layer_indices: dict[tuple[str, str], int] | None = None,
 ) -> None:
     """
     DESCRIPTION:
     Creates points in the Rhino file on the correct sub-sub-layer with colors and attributes.
 
-    :param points: List of points.
+    :param points: List of points (or structured array, see rhino.process.extend_gcode.POINT_DTYPE)
     :param rhino_file: Rhino file.
     :param point_color: Dictionary of color names from setup.Rhino.line_types_color.json
     :param point_print: States if all points are visible in rhino file (true) or only (start, stop, retract, protract, beginning, end) with false
+    :param verbose: If True every added point is printed to the console
+    :param layer_indices: Layer indices from get_layer_indices (collected from rhino_file if None)
     """
+    if layer_indices is None:
+        layer_indices = get_layer_indices(rhino_file)
+
+    added = 0
+    # Layers already reported as missing (one warning each)
+    missing_layers = set()
 
-    for point_data in points:
-        if not point_print and point_data["Point_Info"] not in {
+    # Colors per point info, converted once; unreachable points are displayed black
+    colors = {}
+    unreachable_color = Color.FromArgb(*color_name_to_rgb("#000000"))
+
+    # Columns of the point values used for the points
+    xs, ys, zs, layers, lines, point_numbers, point_infos, reachables = get_columns(
+        points, ("X", "Y", "Z", "Layer", "Line", "Point", "Point_Info", "Reachable")
+    )
+
+    for i, point_info in enumerate(point_infos):
+        if not point_print and point_info not in {
             "start",
             "stop",
             "retract",
@@ -292,31 +394,32 @@ def create_points(
             continue
 
         # formating point info
-        layer_id = f"{point_data['Layer']:04d}"
-        line_id = f"{point_data['Line']:04d}"
-        point_id = f"{point_data['Point']:04d}"
-        point_info = point_data["Point_Info"]
-        reachable = point_data["Reachable"]
-        x, y, z = point_data["X"], point_data["Y"], point_data["Z"]
+        layer_id = zero_pad_id(layers[i])
+        line_id = zero_pad_id(lines[i])
+        point_id = zero_pad_id(point_numbers[i])
+        reachable = reachables[i]
 
         # Create geometry
-        point = Rg.Point3d(x, y, z)
-
-        # Set color
-        color_hex = point_color.get(point_info, "#9B468D")
+        point = Rg.Point3d(xs[i], ys[i], zs[i])
 
         # For unreachable points display color is set to be black
         if reachable:
-            color_rgb = Color.FromArgb(*color_name_to_rgb(color_hex))
+            color_rgb = colors.get(point_info)
+            if color_rgb is None:
+                color_hex = point_color.get(point_info, "#9B468D")
+                color_rgb = Color.FromArgb(*color_name_to_rgb(color_hex))
+                colors[point_info] = color_rgb
         else:
-            color_rgb = Color.FromArgb(*color_name_to_rgb("#000000"))
+            color_rgb = unreachable_color
 
         # Get layer index of current point
-        layer_index = get_layer_index(rhino_file, layer_id, line_id)
+        layer_index = layer_indices.get((layer_id, line_id))
         if layer_index is None:
-            print(
-                f"[WARNING] No Layer found for point {layer_id}/{line_id}/{point_id}. Skipping point"
-            )
+            if (layer_id, line_id) not in missing_layers:
+                missing_layers.add((layer_id, line_id))
+                print(
+                    f"[WARNING] No Layer found for point {layer_id}/{line_id}/{point_id}. Skipping points on this layer"
+                )
             continue
 
         # Object attributes for Attribute User Text
@@ -334,4 +437,8 @@ def create_points(
 
         # Add point to rhino file
         rhino_file.Objects.AddPoint(point, attr)
-        print(f"    Point {layer_id}/{line_id}/{point_id} added")
+        added += 1
+        if verbose:
+            print(f"    Point {layer_id}/{line_id}/{point_id} added")
+
+    print(f"[INFO] Added {added} points")
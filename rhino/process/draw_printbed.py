@@ -5,6 +5,9 @@ from Rhino.FileIO import File3dm
 from Rhino.DocObjects import ObjectAttributes, ObjectColorSource
 
 from System.Drawing import Color
+from System.Collections.Generic import List as NetList
+
+from rhino.process.rhino_file import open_rhino
 
 
 def add_print_bed(
@@ -13,6 +16,7 @@ def add_print_bed(
     """
     DESCRIPTION:
     Adds a print bed surface to a Rhino file under a specified parent or sublayer.
+    Opens and saves the file; use create_print_bed to add the print bed to an already opened file.
 
     :param file_path: Path to the Rhino file.
     :param x_max: Maximum X dimension of the print bed.
@@ -20,12 +24,25 @@ def add_print_bed(
     :param parent_layer: Parent layer name for the print bed.
     :param sublayer: Optional sublayer name. If None, the print bed is added to the parent layer.
     """
-    # Load the existing Rhino file
-    rhino_file = File3dm.Read(str(file_path))
-    if rhino_file is None:
-        print(f"[ERROR] Could not open the Rhino file at {file_path}\n")
-        return False
+    with open_rhino(file_path) as rhino_file:
+        if rhino_file is None:
+            return False
+        return create_print_bed(rhino_file, x_max, y_max, parent_layer, sublayer)
+
+
+def create_print_bed(
+    rhino_file: File3dm, x_max: int, y_max: int, parent_layer: str, sublayer=None
+) -> bool:
+    """
+    DESCRIPTION:
+    Adds a print bed surface to an opened Rhino file under a specified parent or sublayer.
 
+    :param rhino_file: Rhino file
+    :param x_max: Maximum X dimension of the print bed.
+    :param y_max: Maximum Y dimension of the print bed.
+    :param parent_layer: Parent layer name for the print bed.
+    :param sublayer: Optional sublayer name. If None, the print bed is added to the parent layer.
+    """
     # Determine the layer to add the print bed to
     layer_name = f"{sublayer}" if sublayer else f"{parent_layer}"
 
@@ -35,11 +52,15 @@ def add_print_bed(
         print(f"[ERROR] Layer '{layer_name}' not found in the file.\n")
         return False
 
-    # Create the printbed geometry as a 3D rectangle
-    rect = Rg.Rectangle3d(Rg.Plane.WorldXY, float(x_max), float(y_max))
-
-    # Convert the rectangle to a polyline curve
-    rect_curve = rect.ToPolyline().ToNurbsCurve()
+    # Create the printbed outline as closed polyline curve in the XY-plane
+    corners = [
+        Rg.Point3d(0.0, 0.0, 0.0),
+        Rg.Point3d(float(x_max), 0.0, 0.0),
+        Rg.Point3d(float(x_max), float(y_max), 0.0),
+        Rg.Point3d(0.0, float(y_max), 0.0),
+        Rg.Point3d(0.0, 0.0, 0.0),
+    ]
+    rect_curve = Rg.PolylineCurve(NetList[Rg.Point3d](corners))
 
     # Extrude the curve to create a solid
     extrusion = Rg.Extrusion.Create(rect_curve, -50, True)
@@ -54,8 +75,4 @@ def add_print_bed(
     # Add the geometry to the Rhino file
     rhino_file.Objects.AddExtrusion(extrusion, attributes)
     print(f"[INFO] Added print bed to layer '{layer_name}'\n")
-
-    # Save the updated file
-    rhino_file.Write(str(file_path), 8)
-    print(f"[INFO] Updated Rhino file saved to {file_path}\n")
     return True
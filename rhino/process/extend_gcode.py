@@ -1,20 +1,182 @@
+from operator import itemgetter
+
+import numpy as np
+
+# Fixed type codes of the types handled as non-line-type changes
+TRAVEL = 0
+RETRACT = 1
+PROTRACT = 2
+# Type class of all other (printed) types in the point info lookup table
+PRINTED = 3
+
+# Type codes are stored as int8 (enough for the line types of setup.json)
+TYPE_CODE_DTYPE = np.int8
+
+# Type codes known before reading the points (other types get new codes in order of appearance)
+_FIXED_TYPE_CODES = {
+    None: -1,
+    "travel": TRAVEL,
+    "retract": RETRACT,
+    "protract": PROTRACT,
+}
+
+# Type changes (previous, current) for which no transition point is inserted
+_NO_TRANSITION = frozenset(
+    {
+        (TRAVEL, PROTRACT),
+        (RETRACT, TRAVEL),
+        (RETRACT, PROTRACT),
+    }
+)
+
+
+# Point info codes used while calculating the point info (see INFO_NAMES for the stored strings)
+INFO_ZERO = 0
+INFO_ONE = 1
+INFO_START = 2
+INFO_STOP = 3
+INFO_PROTRACT = 4
+INFO_RETRACT = 5
+INFO_BEGINNING = 6
+INFO_END = 7
+
+# Point info string of every point info code
+INFO_NAMES = np.array(
+    ["0", "1", "start", "stop", "protract", "retract", "beginning", "end"]
+)
+
+
+# Point fields after add_point_info as numpy structured array
+# (Type is stored as object as the line types are defined by the user in setup.json;
+# counters are int32, floats stay f8 so values are the same as in the list of dictionaries)
+POINT_DTYPE = np.dtype(
+    [
+        ("Move", "U2"),
+        ("X", "f8"),
+        ("Y", "f8"),
+        ("Z", "f8"),
+        ("E_Rel", "f8"),
+        ("Layer", "i4"),
+        ("Type", "O"),
+        ("Layer_Height", "f8"),
+        ("Reachable", "?"),
+        ("Linewidth", "f8"),
+        ("Flow", "f8"),
+        ("RPM", "f8"),
+        ("Voltage", "f8"),
+        ("Vel_CP_Max", "f8"),
+        ("Line", "i4"),
+        ("Point", "i4"),
+        ("Point_Info", "U9"),
+    ]
+)
+
+
+# Fields which are only added by add_point_info (and their value before)
+_POINT_INFO_FIELDS = {"Line": 0, "Point": 0, "Point_Info": ""}
+
+# Fields every point dictionary has, read in one pass by points_to_array
+_REQUIRED_FIELDS = tuple(
+    name
+    for name in POINT_DTYPE.names
+    if name != "E_Rel" and name not in _POINT_INFO_FIELDS
+)
+_get_required_fields = itemgetter(*_REQUIRED_FIELDS)
+
+# Columns read by assign_count_info and assign_extrusion_info (one pass over the points each)
+_get_count_fields = itemgetter("Layer", "Type")
+_get_extrusion_fields = itemgetter("Type", "Point", "Move")
+
+
+def points_to_array(points: list[dict]) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Converts the list of point dictionaries into a numpy structured array with POINT_DTYPE (filled column by column).
+    'E_rel' of transition points is stored as 'E_Rel'; 'Line', 'Point' and 'Point_Info' may be missing (before add_point_info).
+
+    :param points: List of Dict of point information
+
+    :return: structured array of points
+    """
+    array = np.empty(len(points), dtype=POINT_DTYPE)
+    if not points:
+        return array
+
+    for name, column in zip(_REQUIRED_FIELDS, zip(*map(_get_required_fields, points))):
+        array[name] = column
+    array["E_Rel"] = [point.get("E_Rel", point.get("E_rel")) for point in points]
+    for name, default in _POINT_INFO_FIELDS.items():
+        array[name] = [point.get(name, default) for point in points]
+    return array
+
+
+def array_to_points(points: np.ndarray) -> list[dict]:
+    """
+    DESCRIPTION:
+    Converts a numpy structured array of points back into a list of point dictionaries.
+
+    :param points: structured array of points
+
+    :return: List of Dict of point information
+    """
+    names = points.dtype.names
+    return [dict(zip(names, values)) for values in points.tolist()]
+
+
 def add_point_info(points: list[dict]) -> list[dict]:
     """
     DESCRIPTION:
-    Function to bundle the expansion of the point list
+    Function to bundle the expansion of the point list.
+    Transition points are inserted in one pass which also collects the columns needed for numbering,
+    'Line', 'Point' and 'Point_Info' are then written in a single second pass.
 
     :param points: List of dictionaries with pint information
 
     :return: extended list of dictionaries with transition points and additional information on point numbering
     """
 
-    points_processed = process_points(points)
+    points_processed, layers, type_codes, g1 = _expand_points(points)
+    if not points_processed:
+        return points_processed
+
+    type_codes = np.array(type_codes, dtype=TYPE_CODE_DTYPE)
+    lines, point_numbers = _count_info(np.array(layers), type_codes)
+    info_codes = _info_codes(type_codes, point_numbers, np.array(g1))
+
+    for entry, line, point, info in zip(
+        points_processed,
+        lines.tolist(),
+        point_numbers.tolist(),
+        INFO_NAMES[info_codes].tolist(),
+    ):
+        entry["Line"] = line
+        entry["Point"] = point
+        entry["Point_Info"] = info
+
+    return points_processed
+
+
+def add_point_info_array(points: np.ndarray) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Same as add_point_info for points given as numpy structured array (see POINT_DTYPE and points_to_array).
+
+    :param points: structured array of points
 
-    points_counted = assign_count_info(points_processed)
+    :return: new structured array with transition points and filled 'Line', 'Point' and 'Point_Info'
+    """
+    points_processed, type_codes = _expand_array(points)
+    if len(points_processed) == 0:
+        return points_processed
 
-    points_info = assign_extrusion_info(points_counted)
+    lines, point_numbers = _count_info(points_processed["Layer"], type_codes)
+    points_processed["Line"] = lines
+    points_processed["Point"] = point_numbers
+    points_processed["Point_Info"] = INFO_NAMES[
+        _info_codes(type_codes, point_numbers, points_processed["Move"] == "G1")
+    ]
 
-    return points_info
+    return points_processed
 
 
 def process_points(points: list[dict]) -> list[dict]:
@@ -28,59 +190,211 @@ def process_points(points: list[dict]) -> list[dict]:
 
     :return: List of Dict of points with additional points (duplicates for drawing separate lines for each given type)
     """
+    return _expand_points(points)[0]
+
+
+def _expand_points(points: list[dict]) -> tuple[list[dict], list, list, list]:
+    """
+    DESCRIPTION:
+    Inserts the transition points (see process_points) and collects layer, type code and G1 flag of every resulting point.
+
+    :param points: List of Dict of point information
+
+    :return: (processed points, layers, type codes, G1 flags)
+    """
     processed_points = []
+    append = processed_points.append
+    layers = []
+    type_codes = []
+    g1 = []
+    # type codes, see _type_codes
+    lookup = dict(_FIXED_TYPE_CODES)
     previous_point = None  # Keeps track of the previous point for comparison
+    previous_code = None
 
-    for i, current_point in enumerate(points):
+    for current_point in points:
         current_type = current_point["Type"]
-        current_move = current_point["Move"]
+        current_layer = current_point["Layer"]
+        current_code = lookup.setdefault(current_type, len(lookup) - 1)
+        current_g1 = current_point["Move"] == "G1"
 
         # Add transition point if type changed (exclude defined exceptions)
-        if previous_point:
-            previous_type = previous_point["Type"]
-
-            # If the type does not change, don't insert transition point
-            if previous_type == current_type:
-                processed_points.append(current_point)
-                previous_point = current_point
-                continue
-
-            # No transition point added, if type change to retract or defined cases in list
-            if current_type == "retract" or (previous_type, current_type) in {
-                ("travel", "protract"),
-                ("retract", "travel"),
-                ("retract", "protract"),
-            }:
-                processed_points.append(current_point)
-                previous_point = current_point
-                continue
-
+        # If the type does not change or changes to retract or one of the defined cases, don't insert transition point
+        if (
+            previous_point is not None
+            and previous_code != current_code
+            and current_code != RETRACT
+            and (previous_code, current_code) not in _NO_TRANSITION
+        ):
             # If valid type change; append point
-            transition_point = {
-                "Move": current_move,  # Move from current point
-                "X": previous_point["X"],  # Coordinates of the previous point
-                "Y": previous_point["Y"],
-                "Z": previous_point["Z"],
-                "E_rel": 0,  # Allways set to zero for transitional point as it's the start of a line
-                "Layer": current_point["Layer"],  # layer of current point
-                "Type": current_type,  # Type of current point
-                "Layer_Height": current_point[
-                    "Layer_Height"
-                ],  # layerhight of current point
-                "Reachable": previous_point["Reachable"],
-                "Linewidth": 0,
-                "Flow": 0,
-                "RPM": 0,
-                "Voltage": 0,
-                "Vel_CP_Max": current_point["Vel_CP_Max"],
-            }
-            processed_points.append(transition_point)
+            append(
+                {
+                    "Move": current_point["Move"],  # Move from current point
+                    "X": previous_point["X"],  # Coordinates of the previous point
+                    "Y": previous_point["Y"],
+                    "Z": previous_point["Z"],
+                    "E_rel": 0,  # Allways set to zero for transitional point as it's the start of a line
+                    "Layer": current_layer,  # layer of current point
+                    "Type": current_type,  # Type of current point
+                    "Layer_Height": current_point[
+                        "Layer_Height"
+                    ],  # layerhight of current point
+                    "Reachable": previous_point["Reachable"],
+                    "Linewidth": 0,
+                    "Flow": 0,
+                    "RPM": 0,
+                    "Voltage": 0,
+                    "Vel_CP_Max": current_point["Vel_CP_Max"],
+                }
+            )
+            layers.append(current_layer)
+            type_codes.append(current_code)
+            g1.append(current_g1)
 
         # Append current point
-        processed_points.append(current_point)
+        append(current_point)
+        layers.append(current_layer)
+        type_codes.append(current_code)
+        g1.append(current_g1)
         previous_point = current_point  # Update previous point info with current point
+        previous_code = current_code
 
-    return processed_points
+    return processed_points, layers, type_codes, g1
+
+
+def process_points_array(points: np.ndarray) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Same as process_points for points given as numpy structured array (see POINT_DTYPE).
+
+    :param points: structured array of points
+
+    :return: new structured array with transition points
+    """
+    return _expand_array(points)[0]
+
+
+def _expand_array(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    DESCRIPTION:
+    Inserts the transition points (see process_points) into a structured array of points.
+    Transition points are detected on the type codes of all points at once, the new array is then gathered
+    in one pass with every point that needs a transition point repeated once.
+
+    :param points: structured array of points
+
+    :return: (structured array with transition points, type codes of the resulting points)
+    """
+    type_codes = _type_codes(points["Type"].tolist())
+
+    needs_transition = _needs_transition(type_codes)
+
+    # Type never changes (e.g. single-type prints): nothing to insert
+    if not needs_transition.any():
+        return points.copy(), type_codes
+
+    # Every point that needs a transition point appears twice, the first copy becomes the transition point
+    counts = needs_transition.view(np.int8) + 1
+    gather = np.repeat(np.arange(len(points)), counts)
+    points_processed = points[gather]
+
+    # Index of every point that gets a transition point and the position of its transition point
+    index = np.flatnonzero(needs_transition)
+    position = (np.cumsum(counts) - counts)[index]
+
+    # Transition points take the values of the current point and the coordinates of the previous point
+    previous = points[index - 1]
+    for name in ("X", "Y", "Z", "Reachable"):
+        points_processed[name][position] = previous[name]
+    # Allways set to zero for transitional point as it's the start of a line
+    for name in ("E_Rel", "Linewidth", "Flow", "RPM", "Voltage"):
+        points_processed[name][position] = 0
+
+    return points_processed, type_codes[gather]
+
+
+def _needs_transition(type_codes: np.ndarray) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Checks for every point if a transition point is inserted before it (rules of process_points):
+    the type changes, the current type isn't retract and the change isn't one of _NO_TRANSITION.
+    The exceptions only depend on the type classes, so they are looked up in _SKIP_TRANSITION for all points at once.
+
+    :param type_codes: array of type codes (one per point, see _type_codes)
+
+    :return: bool array (False for the first point)
+    """
+    type_classes = _type_classes(type_codes)
+
+    needs_transition = np.zeros(len(type_codes), dtype=bool)
+    needs_transition[1:] = (type_codes[:-1] != type_codes[1:]) & ~_SKIP_TRANSITION[
+        type_classes[:-1], type_classes[1:]
+    ]
+    return needs_transition
+
+
+def _build_skip_transition_table() -> np.ndarray:
+    """
+    DESCRIPTION:
+    Builds the lookup table if no transition point is inserted for a type change (previous type class, current type class):
+    changes to retract and the changes of _NO_TRANSITION.
+
+    :return: bool array with shape (4, 4)
+    """
+    table = np.zeros((PRINTED + 1, PRINTED + 1), dtype=bool)
+    table[:, RETRACT] = True
+    for previous_class, current_class in _NO_TRANSITION:
+        table[previous_class, current_class] = True
+    return table
+
+
+# No transition point per (previous type class, current type class)
+_SKIP_TRANSITION = _build_skip_transition_table()
+
+
+def _type_codes(types: list | tuple) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Maps the line type of every point to an integer code, so type comparisons can be done on whole arrays.
+    None is mapped to -1, travel/retract/protract to the fixed codes 0/1/2 and every other type gets a new code
+    in order of appearance.
+
+    :param types: Type of every point
+
+    :return: int8 array of type codes (one per point)
+    """
+    lookup = dict(_FIXED_TYPE_CODES)
+    return np.fromiter(
+        (lookup.setdefault(line_type, len(lookup) - 1) for line_type in types),
+        dtype=TYPE_CODE_DTYPE,
+        count=len(types),
+    )
+
+
+def _type_classes(type_codes: np.ndarray) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Maps the type codes to the type classes of the lookup tables:
+    travel/retract/protract keep their code, every other type (including None) is a printed type.
+
+    :param type_codes: array of type codes (see _type_codes)
+
+    :return: array of type classes (TRAVEL, RETRACT, PROTRACT or PRINTED)
+    """
+    return np.where(is_ignored(type_codes), type_codes, PRINTED)
+
+
+def is_ignored(type_codes: np.ndarray) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Checks which type codes belong to the types handled as non-line-type changes (travel, retract, protract).
+    These have the consecutive fixed codes TRAVEL..PROTRACT, so the set membership is a range check.
+
+    :param type_codes: array of type codes (see _type_codes)
+
+    :return: bool array
+    """
+    return (type_codes >= TRAVEL) & (type_codes <= PROTRACT)
 
 
 def assign_count_info(processed_points: list[dict]) -> list[dict]:
@@ -99,63 +413,72 @@ def assign_count_info(processed_points: list[dict]) -> list[dict]:
 
     :return: List of Dict of points with transition points and additional information on point numbering (Layer/line/Point)
     """
+    if not processed_points:
+        return processed_points
+
+    layers, types = zip(*map(_get_count_fields, processed_points))
+    lines, point_numbers = _count_info(np.array(layers), _type_codes(types))
 
-    previous_layer = 0
-    previous_type = None
-    line_counter = -1
-    point_counter = 0
-
-    # types handled as non-line-type changes
-    ignored_type_transitions = {"travel", "retract", "protract"}
-
-    for entry in processed_points:
-        current_layer = entry["Layer"]
-        current_type = entry["Type"]
-
-        # If layer changes reset to zero
-        if previous_layer != current_layer:
-            line_counter = -1
-            point_counter = 0
-            previous_layer = current_layer
-            previous_type = None
-
-        # checks if type change can be ignored
-        is_current_ignored = current_type in ignored_type_transitions
-        is_previous_ignored = (
-            previous_type in ignored_type_transitions if previous_type else False
-        )
-
-        # Wenn der Typ wechselt
-        if previous_type != current_type:
-            if is_previous_ignored and not is_current_ignored:
-                # Change from travel/retract/protract -> counted type (e.g. wall_outer)
-                line_counter += 1
-                point_counter = 0
-            elif not is_previous_ignored and is_current_ignored:
-                # Change from counted type -> travel/retract/protract
-                line_counter += 1
-                point_counter = 0
-            elif not is_previous_ignored and not is_current_ignored:
-                # Change in between to counted types (e.g. wall_outer -> infill)
-                line_counter += 1
-                point_counter = 0
-
-        # Directly update the entry
-        entry.update({"Line": line_counter, "Point": point_counter})
-
-        point_counter += 1
-        previous_type = current_type
+    # Directly update the entries
+    for entry, line, point in zip(
+        processed_points, lines.tolist(), point_numbers.tolist()
+    ):
+        entry["Line"] = line
+        entry["Point"] = point
 
     return processed_points
 
 
+def _count_info(
+    layers: np.ndarray, type_codes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    DESCRIPTION:
+    Calculates line and point numbers following the rules of assign_count_info.
+
+    :param layers: array of layer numbers (one per point)
+    :param type_codes: array of type codes (one per point, see _type_codes)
+
+    :return: (line numbers, point numbers)
+    """
+    n = len(type_codes)
+    # types handled as non-line-type changes (travel, retract, protract)
+    ignored = is_ignored(type_codes)
+
+    # A new layer starts at the first point and on every change in layer
+    layer_start = np.ones(n, dtype=bool)
+    layer_start[1:] = layers[1:] != layers[:-1]
+
+    # Previous type is reset (None) at the start of a layer
+    previous_codes = np.full(n, -1, dtype=TYPE_CODE_DTYPE)
+    previous_codes[1:] = type_codes[:-1]
+    previous_codes[layer_start] = -1
+    previous_ignored = np.zeros(n, dtype=bool)
+    previous_ignored[1:] = ignored[:-1]
+    previous_ignored[layer_start] = False
+
+    # New line on every type change, except in between travel/retract/protract
+    new_line = (previous_codes != type_codes) & ~(previous_ignored & ignored)
+
+    # Line counter starts at -1 for every layer and increases with every new line
+    line_total = np.cumsum(new_line)
+    line_offset = np.maximum.accumulate(np.where(layer_start, line_total - new_line, 0))
+    lines = line_total - line_offset - 1
+
+    # Point counter is reset to zero with every new line or layer
+    index = np.arange(n)
+    restart = np.maximum.accumulate(np.where(new_line | layer_start, index, 0))
+
+    return lines, index - restart
+
+
 def assign_extrusion_info(counted_points: list[dict]) -> list[dict]:
     """
     DESCRIPTION:
     Assigns 'Point_Info' based on movement type and position within a line.
 
-    Rules:
-    - Travel -> Point_Info = "0"
+    Rules (checked in this order, see _INFO_TABLE):
+    - Travel -> Point_Info = "0" (also for the first point of a travel line)
     - Protract -> Point_Info = "protract""
     - Retract -> Point_Info = "retract"
     - If Point == 0 -> "start"
@@ -168,43 +491,104 @@ def assign_extrusion_info(counted_points: list[dict]) -> list[dict]:
 
     :return: List of Dict of points with additional information on extrusion info
     """
+    if not counted_points:
+        return counted_points
 
-    ignored_type_transitions = {"travel", "retract", "protract"}
-
-    # Iteration with zip to access both current and next point (+[None] to iterate over the last point as well)
-    for current_entry, next_entry in zip(counted_points, counted_points[1:] + [None]):
-        move = current_entry["Move"]
-        line_type = current_entry["Type"]
-        point = current_entry["Point"]
-
-        # Set information for different types
-        if line_type == "travel":
-            point_info = "0"
-        elif line_type == "protract":
-            point_info = "protract"
-        elif line_type == "retract":
-            point_info = "retract"
-        elif point == 0:
-            point_info = "start"
-        elif (
-            next_entry is not None  # Assures there is a next point available
-            and line_type
-            not in ignored_type_transitions  # line_type != travel, retract oder protract
-            and next_entry["Type"] != line_type  # Checks if type change is made
-        ):
-            point_info = "stop"
-
-        else:
-            point_info = "1" if move == "G1" else "0"
+    types, point_numbers, moves = zip(*map(_get_extrusion_fields, counted_points))
+    point_info = _extrusion_info(
+        _type_codes(types), np.array(point_numbers), np.array(moves) == "G1"
+    )
 
-        current_entry.update({"Point_Info": point_info})
-    if counted_points:
-        counted_points[0].update({"Point_Info": "beginning"})
-        counted_points[-1].update({"Point_Info": "end"})
+    for current_entry, info in zip(counted_points, point_info):
+        current_entry["Point_Info"] = info
 
     return counted_points
 
 
+def _extrusion_info(
+    type_codes: np.ndarray, point_numbers: np.ndarray, g1: np.ndarray
+) -> list[str]:
+    """
+    DESCRIPTION:
+    Calculates the point info strings following the rules of assign_extrusion_info (see _info_codes).
+
+    :param type_codes: array of type codes (one per point, see _type_codes)
+    :param point_numbers: array of point numbers within their line
+    :param g1: bool array if the move of the point is G1
+
+    :return: list of point info strings
+    """
+    return INFO_NAMES[_info_codes(type_codes, point_numbers, g1)].tolist()
+
+
+def _info_codes(
+    type_codes: np.ndarray, point_numbers: np.ndarray, g1: np.ndarray
+) -> np.ndarray:
+    """
+    DESCRIPTION:
+    Calculates the point info code following the rules of assign_extrusion_info.
+    The first point is marked as INFO_BEGINNING and the last point as INFO_END.
+
+    :param type_codes: array of type codes (one per point, see _type_codes)
+    :param point_numbers: array of point numbers within their line
+    :param g1: bool array if the move of the point is G1
+
+    :return: int8 array of point info codes (see INFO_NAMES)
+    """
+    n = len(type_codes)
+
+    # Checks if the type changes to the next point (no change for the last point)
+    type_change = np.zeros(n, dtype=bool)
+    type_change[:-1] = type_codes[:-1] != type_codes[1:]
+
+    # Boolean conditions as 0/1 indices of the table
+    info_codes = _INFO_TABLE[
+        _type_classes(type_codes),
+        (point_numbers == 0).view(np.int8),
+        np.asarray(g1, dtype=bool).view(np.int8),
+        type_change.view(np.int8),
+    ]
+    info_codes[0] = INFO_BEGINNING
+    info_codes[-1] = INFO_END
+
+    return info_codes
+
+
+def _build_info_table() -> np.ndarray:
+    """
+    DESCRIPTION:
+    Builds the lookup table of the point info for every combination of
+    (type class, first point of line, G1 move, type changes to next point), following the rules of assign_extrusion_info.
+    Travel, retract and protract are checked before the first point, so the first point of a travel line is "0"
+    (and not "start"); "start" and "stop" only mark printed lines.
+
+    :return: int8 array of point info codes with shape (4, 2, 2, 2)
+    """
+    table = np.empty((PRINTED + 1, 2, 2, 2), dtype=np.int8)
+    for type_class in (TRAVEL, RETRACT, PROTRACT, PRINTED):
+        for first in (0, 1):
+            for g1 in (0, 1):
+                for type_change in (0, 1):
+                    if type_class == TRAVEL:
+                        info = INFO_ZERO
+                    elif type_class == PROTRACT:
+                        info = INFO_PROTRACT
+                    elif type_class == RETRACT:
+                        info = INFO_RETRACT
+                    elif first:
+                        info = INFO_START
+                    elif type_change:
+                        info = INFO_STOP
+                    else:
+                        info = INFO_ONE if g1 else INFO_ZERO
+                    table[type_class, first, g1, type_change] = info
+    return table
+
+
+# Point info code per (type class, first point of line, G1 move, type changes to next point)
+_INFO_TABLE = _build_info_table()
+
+
 if __name__ == "__main__":
 
     p = [
@@ -1,8 +1,20 @@
+from functools import lru_cache
 from pathlib import Path
 import Rhino.Geometry as Rg
 import Rhino.FileIO as Rfi
 import Rhino.DocObjects as Rdo
 
+from rhino.process.rhino_file import open_rhino
+
+# Adds a geometry to the object table per supported geometry type (subclasses use the first matching entry)
+_ADD_GEOMETRY = {
+    Rg.Point: lambda objects, geom, attr: objects.AddPoint(geom.Location, attr),
+    Rg.Curve: lambda objects, geom, attr: objects.AddCurve(geom, attr),
+    Rg.Line: lambda objects, geom, attr: objects.AddLine(geom, attr),
+    Rg.Brep: lambda objects, geom, attr: objects.AddBrep(geom, attr),
+    Rg.Mesh: lambda objects, geom, attr: objects.AddMesh(geom, attr),
+}
+
 
 def import_step_file_to_rhino_file(
     file_path: Path,
@@ -14,16 +26,38 @@ def import_step_file_to_rhino_file(
     DESCRIPTION:
     Imports a .3dm file (file_path) into an existing Rhino file (target_3dm_path),
     moves the contents around the origin to the target_point position, and adds the specified layer to it.
+    Opens and saves the target file; use import_robot to import into an already opened file.
 
     :param file_path: Path to the .3dm file.
     :param target_point: Position of Robotroot relative to printbed origin (make sure x-axis and  y-axis of printbed and robot are parallel)
     :param target_3dm_path: Path to the .3dm file.
     :param target_layer_name: layer in which the robot file is imported to
     """
+    with open_rhino(target_3dm_path) as rhino_file:
+        if rhino_file is None:
+            return
+        import_robot(file_path, target_point, rhino_file, target_layer_name)
+
+
+def import_robot(
+    file_path: Path,
+    target_point: list[float],
+    rhino_file: Rfi.File3dm,
+    target_layer_name="robot",
+):
+    """
+    DESCRIPTION:
+    Imports a .3dm file (file_path) into an opened Rhino file,
+    moves the contents around the origin to the target_point position, and adds the specified layer to it.
+
+    :param file_path: Path to the .3dm file.
+    :param target_point: Position of Robotroot relative to printbed origin (make sure x-axis and  y-axis of printbed and robot are parallel)
+    :param rhino_file: Rhino file the robot is imported to
+    :param target_layer_name: layer in which the robot file is imported to
+    """
 
     # Load data from .3dm file
     robot_model = Rfi.File3dm.Read(str(file_path))
-    rhino_file = Rfi.File3dm.Read(str(target_3dm_path))
 
     if not robot_model:
         print(f"[ERROR] File for Robot '{str(file_path)}' can't be read")
@@ -40,34 +74,54 @@ def import_step_file_to_rhino_file(
     # Calculate transformation necessary
     translation = Rg.Transform.Translation(Rg.Vector3d(tp))
 
+    # Same attributes for all objects (the object table stores a copy with every added object)
+    attr = Rdo.ObjectAttributes()
+    attr.LayerIndex = target_layer_index
+
     # Add geometry to file
-    enumerator = robot_model.Objects.GetEnumerator()
-    while enumerator.MoveNext():
-        obj = enumerator.Current
-        geom = obj.Geometry.Duplicate()
+    unsupported_types = set()
+    # robot_model is only read here, so its geometry is transformed in place instead of being duplicated first
+    for obj in robot_model.Objects:
+        geom = obj.Geometry
         if geom:
             geom.Transform(translation)
-            attr = Rdo.ObjectAttributes()
-            attr.LayerIndex = target_layer_index
-
-            if isinstance(geom, Rg.Point):
-                rhino_file.Objects.AddPoint(geom.Location, attr)
-            elif isinstance(geom, Rg.Curve):
-                rhino_file.Objects.AddCurve(geom, attr)
-            elif isinstance(geom, Rg.Line):
-                rhino_file.Objects.AddLine(geom, attr)
-            elif isinstance(geom, Rg.Brep):
-                rhino_file.Objects.AddBrep(geom, attr)
-            elif isinstance(geom, Rg.Mesh):
-                rhino_file.Objects.AddMesh(geom, attr)
+
+            add_geometry = get_add_geometry(type(geom))
+            if add_geometry:
+                add_geometry(rhino_file.Objects, geom, attr)
             else:
-                print(f"[WARNING] Geometry type {type(geom)} not supported")
-                print(
-                    "[INFO] Make sure robot.3dm file only consists of Points, Curves, Lines, Brep, Mesh\n"
-                )
+                unsupported_types.add(type(geom))
+
+    for geom_type in unsupported_types:
+        print(f"[WARNING] Geometry type {geom_type} not supported")
+    if unsupported_types:
+        print(
+            "[INFO] Make sure robot.3dm file only consists of Points, Curves, Lines, Brep, Mesh\n"
+        )
 
-    # Save file
-    rhino_file.Write(str(target_3dm_path), 8)
     print(
-        f"[INFO] Robot from '{file_path}' imported in '{target_3dm_path}' onto layer '{target_layer_name}' at position {tp}.\n"
+        f"[INFO] Robot from '{file_path}' imported onto layer '{target_layer_name}' at position {tp}.\n"
     )
+
+
+@lru_cache(maxsize=None)
+def get_add_geometry(geom_type: type):
+    """
+    DESCRIPTION:
+    Looks up how a geometry type is added to the object table (see _ADD_GEOMETRY), cached per concrete type.
+
+    :param geom_type: type of the geometry
+
+    :return: function (objects, geom, attr) adding the geometry (or None if the type is not supported)
+    """
+    add_geometry = _ADD_GEOMETRY.get(geom_type)
+    if add_geometry is None:
+        add_geometry = next(
+            (
+                add
+                for base_type, add in _ADD_GEOMETRY.items()
+                if issubclass(geom_type, base_type)
+            ),
+            None,
+        )
+    return add_geometry
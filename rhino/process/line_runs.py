@@ -0,0 +1,192 @@
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
+
+
+def get_columns(points: list[dict] | np.ndarray, names: tuple[str, ...]) -> list:
+    """
+    DESCRIPTION:
+    Extracts the given fields of all points as columns, so loops over the points index plain sequences.
+    Points can be given as list of dictionaries or as numpy structured array (see rhino.process.extend_gcode.POINT_DTYPE).
+
+    :param points: List of points or structured array of points
+    :param names: field names to extract
+
+    :return: one column (sequence of values) per name
+    """
+    if isinstance(points, np.ndarray):
+        return [points[name].tolist() for name in names]
+    if len(points) == 0:
+        return [[] for _ in names]
+    # Rows of values with one C-level call per point, transposed into columns
+    return list(zip(*map(itemgetter(*names), points)))
+
+
+@lru_cache(maxsize=4096)
+def zero_pad_id(number: int) -> str:
+    """
+    DESCRIPTION:
+    Formats a Layer/Line/Point/Segment number as zero padded Id (Example: 12 -> '0012').
+    Ids repeat for every segment and point of a line, so the formatted strings are cached.
+
+    :param number: number to format
+
+    :return: zero padded Id
+    """
+    return f"{number:04d}"
+
+
+def get_line_runs(layers: list[int], lines: list[int]) -> list[tuple[int, int]]:
+    """
+    DESCRIPTION:
+    Splits the points into runs of consecutive points with the same Layer and Line.
+
+    :param layers: Layer of every point
+    :param lines: Line of every point
+
+    :return: List of (start, end) indices of the runs (end exclusive)
+    """
+    n = len(layers)
+    if n == 0:
+        return []
+
+    layers = np.asarray(layers)
+    lines = np.asarray(lines)
+
+    # Index of first point after every change in Layer or Line
+    breaks = (
+        np.flatnonzero((layers[1:] != layers[:-1]) | (lines[1:] != lines[:-1])) + 1
+    ).tolist()
+
+    return list(zip([0] + breaks, breaks + [n]))
+
+
+def get_segment_runs(
+    points: list[dict] | np.ndarray,
+    linetype_dict: dict[str, str],
+    line_widths: dict[str, float],
+    precision: int,
+) -> list[tuple[int, int, int, int, tuple]]:
+    """
+    DESCRIPTION:
+    Creates the line segments (pairs of consecutive points with the same Layer and Line) and groups consecutive
+    segments of a line with identical attributes into runs. For some type changes a travel segment is created.
+    Segments are numbered per Layer/Line starting at 0 (numbers continue if the Layer/Line of the previous line is repeated).
+
+    :param points: List of points (or structured array, see rhino.process.extend_gcode.POINT_DTYPE)
+    :param linetype_dict: Dictionary of line types from setup.Rhino.line_types_line.json
+    :param line_widths: Dictionary of line widths from setup.Rhino.line_width.json
+    :param precision: Precision of values displayed in Attribute User Text Strings.
+
+    :return: List of runs (start, end, first segment, last segment, key); the run connects the points start to end
+    (end exclusive), key is (forced type, visual type, user strings, plot weight) shared by all segments of the run
+    """
+    # no new line created if type transitions within blocked
+    blocked = {
+        ("travel", "retract"),
+        ("retract", "travel"),
+        ("travel", "protract"),
+        ("protract", "travel"),
+        ("retract", "protract"),
+        ("protract", "retract"),
+    }
+
+    (
+        layers,
+        lines,
+        types,
+        moves,
+        point_infos,
+        linewidths,
+        flows,
+        rpms,
+        voltages,
+        velocities,
+    ) = get_columns(
+        points,
+        (
+            "Layer",
+            "Line",
+            "Type",
+            "Move",
+            "Point_Info",
+            "Linewidth",
+            "Flow",
+            "RPM",
+            "Voltage",
+            "Vel_CP_Max",
+        ),
+    )
+
+    prev_layer = None
+    prev_line = None
+    segment_index = 0
+    runs = []
+
+    # Segments only connect points of the same Layer and Line; iterate over these runs of points
+    for start, end in get_line_runs(layers, lines):
+        if end - start < 2:
+            continue
+
+        layer_id = zero_pad_id(layers[start])
+        line_id = zero_pad_id(lines[start])
+
+        # Reset Segment Id counter
+        if layer_id != prev_layer or line_id != prev_line:
+            segment_index = 0
+
+        prev_layer = layer_id
+        prev_line = line_id
+
+        # Current run of consecutive segments sharing the same attributes
+        run_key = None
+
+        for i in range(start, end - 1):
+            # Segment from point i to point j
+            j = i + 1
+
+            # Check for change in Type
+            # Plot retract and protract as travel
+            type_pair = (types[i], types[j])
+            if type_pair in blocked:
+                visual_type = "travel"
+                forced_type = "travel"
+            else:
+                visual_type = (
+                    "travel" if types[j] in {"retract", "protract"} else types[j]
+                )
+                forced_type = types[j]
+
+            # Values displayed in Attribute User Text
+            user_strings = (
+                ("Layer", layer_id),
+                ("Line", line_id),
+                ("Extrusion", "1" if point_infos[j] != "0" else "0"),
+                ("Linewidth [mm]", str(round(linewidths[j], precision))),
+                ("Flow [mm^3/s]", str(round(flows[j], precision))),
+                ("RPM [1/min]", str(round(rpms[j], precision))),
+                ("Voltage [V]", str(round(voltages[j], precision))),
+                ("Velocity [m/s]", str(round(velocities[j], precision))),
+            )
+
+            linetype_name = linetype_dict.get(visual_type, "Continuous")
+
+            # Linewidth for Print View determined either by Flow (Linewidth) for G1 or setup.Rhino.line_width.json
+            if moves[j] == "G1":
+                plot_weight = round(linewidths[j], precision)
+            else:
+                plot_weight = line_widths.get(linetype_name.lower(), 0.5)
+
+            key = (forced_type, visual_type, user_strings, plot_weight)
+            if key == run_key:
+                # Extend current run by point j
+                first_segment = runs[-1][2]
+                runs[-1] = (runs[-1][0], j + 1, first_segment, segment_index, key)
+            else:
+                # Start new run with this segment
+                runs.append((i, j + 1, segment_index, segment_index, key))
+                run_key = key
+
+            segment_index += 1
+
+    return runs
@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import Rhino.FileIO as Rfi
+
+
+class RhinoSession:
+    """
+    DESCRIPTION:
+    Shares one Rhino file between several drawing steps.
+    The file is read on first access of 'file' and written once when the session is closed
+    (File3dm can only write the whole file, so all changes are collected before writing).
+    """
+
+    def __init__(self, filepath: Path):
+        """
+        DESCRIPTION:
+        Creates a session for the Rhino file at filepath; the file is not read yet.
+
+        :param filepath: Path to the Rhino file.
+        """
+        self.filepath = Path(filepath)
+        self._file = None
+        self._read = False
+
+    @property
+    def file(self) -> Rfi.File3dm | None:
+        """
+        DESCRIPTION:
+        Rhino file of the session, read on first access.
+
+        :return: opened Rhino file (or None if it can't be read)
+        """
+        if not self._read:
+            self._read = True
+            self._file = Rfi.File3dm.Read(str(self.filepath))
+            if self._file is None:
+                print(f"[ERROR] Could not open the Rhino file at {self.filepath}\n")
+        return self._file
+
+    def write(self) -> bool:
+        """
+        DESCRIPTION:
+        Writes the Rhino file if it was read in this session.
+
+        :return: bool if file was written
+        """
+        if self._file is None:
+            return False
+
+        self._file.Write(str(self.filepath), 8)
+        print(f"[INFO] Updated Rhino file saved to {self.filepath}\n")
+        return True
+
+    def __enter__(self) -> "RhinoSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        # Don't save a partly drawn file if a step raised an exception
+        if exc_type is None:
+            self.write()
+        return False
+
+
+@contextmanager
+def open_rhino(filepath: Path) -> Iterator[Rfi.File3dm | None]:
+    """
+    DESCRIPTION:
+    Opens a Rhino file once so several drawing steps can share it, and writes it back once when the block is left.
+    Yields None if the file can't be read; the file is not written if the block raises an exception.
+
+    :param filepath: Path to the Rhino file.
+
+    :return: opened Rhino file (or None)
+    """
+    with RhinoSession(filepath) as session:
+        yield session.file
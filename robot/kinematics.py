@@ -1,9 +1,12 @@
 import numpy as np
 import math
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Iterable
 from numpy import ndarray, dtype
 
-from robot.mathematical_operators import Rotation
+# Number of points solved at once in RobotOPW.calculate_inverse_kinematics
+IK_CHUNK_SIZE = 1024
 
 
 class RobotOPW:
@@ -49,6 +52,14 @@ class RobotOPW:
         self.c3 = robot_geometry["c3"]
         self.c4 = robot_geometry["c4"]
 
+        # Invariants of the geometry used in the kinematics
+        self._k = np.sqrt(self.a2**2 + self.c3**2)
+        self._k2 = self._k**2
+        self._psi3 = np.arctan(self.a2 / self.c3)
+        self._atan2_a2_c3 = np.atan2(self.a2, self.c3)
+        self._b2 = self.b**2
+        self._c2_2 = self.c2**2
+
         # Base dimensions
         self.base_r = robot_base_radius
 
@@ -56,6 +67,11 @@ class RobotOPW:
         self.tool_offset_x = robot_tool_offset["X"]
         self.tool_offset_y = robot_tool_offset["Y"]
         self.tool_offset_z = robot_tool_offset["Z"]
+        self._tool_vec = np.array(
+            [self.tool_offset_x, self.tool_offset_y, self.tool_offset_z], dtype=float
+        )
+        # Without tool offset the kinematics skip applying it
+        self._has_tool = bool(self._tool_vec.any())
 
         # Rotation properties
         self.offset = np.array(
@@ -67,7 +83,14 @@ class RobotOPW:
                 for i in range(self.num_axis)
             ]
         )
+        # sign and offset as columns to correct solutions [6xn] at once
+        self._sign_col = self.sign.reshape(-1, 1)
+        self._offset_col = self.offset.reshape(-1, 1)
         self.lim = robot_rotation_limit
+        # lower and upper joint limits as arrays (order A1-A6)
+        self._lim_lo, self._lim_hi = np.array(
+            [self.lim[f"A{i + 1}"] for i in range(self.num_axis)], dtype=float
+        ).T
 
         self.precision = 5
 
@@ -120,12 +143,10 @@ class RobotOPW:
 
         return: Boolean if given joint angles are valid (True) else (False)
         """
-        for joint, value in joint_angles.items():
-            lower, upper = self.lim[joint]
-            if not (lower <= value <= upper):
-                return False
-
-        return True
+        values = np.array(
+            [joint_angles[f"A{i + 1}"] for i in range(self.num_axis)], dtype=float
+        )
+        return bool(np.all((self._lim_lo <= values) & (values <= self._lim_hi)))
 
     def validate_joint_limits_ik(
         self, solutions_deg: np.ndarray[Any, dtype]
@@ -138,31 +159,12 @@ class RobotOPW:
 
         return: Array of valid solutions [6xn_valid]; if no solution valid[6x0]
         """
-        valid_solutions = []
-
-        joint_names = ["A1", "A2", "A3", "A4", "A5", "A6"]
-
-        for i in range(
-            solutions_deg.shape[1]
-        ):  # iterate through every given solution column in list
-            solution = solutions_deg[:, i]
-            within_limits = True
-
-            # Check each given joint angle to be within corresponding limits
-            for j, joint in enumerate(joint_names):
-                lower, upper = self.lim[joint]
-                if not (lower <= np.round(solution[j], self.precision) <= upper):
-                    within_limits = False
-                    break
-            # If all joint angles for one column are within the limits append solution
-            if within_limits:
-                valid_solutions.append(solution)
-        # Transposed solution matrix of valid joint angles
-        return (
-            np.array(valid_solutions).T
-            if valid_solutions
-            else np.array([]).reshape(6, 0)
-        )
+        # Columns with all (rounded) joint angles within the corresponding limits
+        rounded = np.round(solutions_deg, self.precision)
+        within_limits = (
+            (self._lim_lo[:, None] <= rounded) & (rounded <= self._lim_hi[:, None])
+        ).all(axis=0)
+        return solutions_deg[:, within_limits]
 
     def validate_self_intersecting(
         self, x: np.ndarray, y: np.ndarray, z: np.ndarray
@@ -184,6 +186,44 @@ class RobotOPW:
 
         return True  # no self collision
 
+    def validate_reach(self, hom_trans: np.ndarray) -> np.ndarray:
+        """
+        DESCRIPTION:
+        Checks for many points at once if the wrist center can be reached by the arm (c2 and k = sqrt(a2^2 + c3^2)) for
+        any value of theta1 (positional part of inverse_kinematics). Used to skip the inverse kinematics of points that
+        are out of reach; points inside the robot base count as reachable here (checked by inverse_kinematics).
+
+        :param hom_trans: homogenous transformation matrices [nx4x4] in "Brandstötter et al." convention
+
+        :return: bool array [n]; False only if the point is out of reach for sure
+        """
+        x, y, z = hom_trans[:, 0, 3], hom_trans[:, 1, 3], hom_trans[:, 2, 3]
+        r0e = hom_trans[:, :3, :3]
+
+        # Wrist center position (see inverse_kinematics)
+        wrist = hom_trans[:, :3, 3]
+        if self._has_tool:
+            wrist = wrist - r0e @ self._tool_vec
+        wrist = wrist - self.c4 * r0e[:, :, 2]
+        cx0, cy0, cz0 = wrist[:, 0], wrist[:, 1], wrist[:, 2]
+
+        # Points inside the base and points inside the offset b are left to inverse_kinematics
+        inside_base = (x**2 + y**2 <= self.base_r**2) & (0 <= z) & (z <= self.c1)
+        outside_b = cx0**2 + cy0**2 >= self._b2
+
+        n_x1 = np.sqrt(np.where(outside_b, cx0**2 + cy0**2 - self._b2, 0)) - self.a1
+        s_12 = n_x1**2 + (cz0 - self.c1) ** 2
+        s_22 = (n_x1 + 2 * self.a1) ** 2 + (cz0 - self.c1) ** 2
+
+        # theta3 only exists if acos is defined for one of both shoulder configurations
+        # (small margin, so rounding never rejects a point inverse_kinematics would solve)
+        limit = 1 + 1e-9
+        value3_12 = (s_12 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
+        value3_34 = (s_22 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
+        out_of_reach = (np.abs(value3_12) > limit) & (np.abs(value3_34) > limit)
+
+        return ~(out_of_reach & outside_b & ~inside_base)
+
     def forward_kinematics(
         self, joint_angles: dict[str, float]
     ) -> tuple[ndarray[Any, dtype], bool]:
@@ -203,28 +243,19 @@ class RobotOPW:
             return np.ndarray([]), reachable
         else:
             reachable = True
-            ja = np.deg2rad(
-                self.sub_correction(
-                    [
-                        joint_angles["A1"],
-                        joint_angles["A2"],
-                        joint_angles["A3"],
-                        joint_angles["A4"],
-                        joint_angles["A5"],
-                        joint_angles["A6"],
-                    ]
-                )
+            # joint angles in "Brandstötter et al." convention [rad] (sub_correction and deg2rad in one step)
+            values = np.array(
+                [joint_angles[f"A{i + 1}"] for i in range(self.num_axis)], dtype=float
             )
+            ja = (values * self.sign - self.offset) * (np.pi / 180)
 
             # forward kinematics (orientation part)
-            s, c = np.sin(ja), np.cos(ja)
+            s, c = np.sin(ja).tolist(), np.cos(ja).tolist()
 
-            psi3 = np.arctan(self.a2 / self.c3)
-            k = np.sqrt(self.a2**2 + self.c3**2)
-
-            cx1 = self.c2 * s[1] + k * np.sin(ja[1] + ja[2] + psi3) + self.a1
+            q23 = ja[1] + ja[2] + self._psi3
+            cx1 = self.c2 * s[1] + self._k * math.sin(q23) + self.a1
             cy1 = self.b
-            cz1 = self.c2 * c[1] + k * np.cos(ja[1] + ja[2] + psi3)
+            cz1 = self.c2 * c[1] + self._k * math.cos(q23)
 
             cx0 = cx1 * c[0] - cy1 * s[0]
             cy0 = cx1 * s[0] + cy1 * c[0]
@@ -238,44 +269,11 @@ class RobotOPW:
                 )
                 return np.ndarray([]), reachable
 
-            r_0c = np.array(
-                [
-                    [
-                        c[0] * c[1] * c[2] - c[0] * s[1] * s[2],
-                        -s[0],
-                        c[0] * c[1] * s[2] + c[0] * s[1] * c[2],
-                    ],
-                    [
-                        s[0] * c[1] * c[2] - s[0] * s[1] * s[2],
-                        c[0],
-                        s[0] * c[1] * s[2] + s[0] * s[1] * c[2],
-                    ],
-                    [-s[1] * c[2] - c[1] * s[2], 0, -s[1] * s[2] + c[1] * c[2]],
-                ]
-            )
-
-            r_ce = np.array(
-                [
-                    [
-                        c[3] * c[4] * c[5] - s[3] * s[5],
-                        -c[3] * c[4] * s[5] - s[3] * c[5],
-                        c[3] * s[4],
-                    ],
-                    [
-                        s[3] * c[4] * c[5] + c[3] * s[5],
-                        -s[3] * c[4] * s[5] + c[3] * c[5],
-                        s[3] * s[4],
-                    ],
-                    [-s[4] * c[5], s[4] * s[5], c[4]],
-                ]
-            )
+            r_0e = self._rotation_0e(s, c)
 
-            r_0e = r_0c @ r_ce
-
-            u = np.array([cx0, cy0, cz0]) + self.c4 * (r_0e @ np.array([0, 0, 1]))
-            u += r_0e @ np.array(
-                [self.tool_offset_x, self.tool_offset_y, self.tool_offset_z]
-            )
+            u = np.array([cx0, cy0, cz0]) + self.c4 * r_0e[:, 2]
+            if self._has_tool:
+                u += r_0e @ self._tool_vec
 
             # Check for self collision of end-effector with base
             if not self.validate_self_intersecting(u[0], u[1], u[2]):
@@ -291,58 +289,115 @@ class RobotOPW:
 
             return t, reachable
 
+    @staticmethod
+    def _rotation_0e(s: list[float], c: list[float]) -> np.ndarray:
+        """
+        DESCRIPTION:
+        Rotational matrix from base to endeffector (r_0c @ r_ce) for the forward kinematics.
+        The 3x3 product is written out on floats, so no intermediate matrices are created.
+
+        :param s: sinus of the six joint angles in "Brandstötter et al." convention [rad]
+        :param c: cosinus of the six joint angles in "Brandstötter et al." convention [rad]
+
+        :return: rotational matrix [3x3]
+        """
+        # Rows of the rotational matrix from base to wrist center (r_0c)
+        r_0c = (
+            (
+                c[0] * c[1] * c[2] - c[0] * s[1] * s[2],
+                -s[0],
+                c[0] * c[1] * s[2] + c[0] * s[1] * c[2],
+            ),
+            (
+                s[0] * c[1] * c[2] - s[0] * s[1] * s[2],
+                c[0],
+                s[0] * c[1] * s[2] + s[0] * s[1] * c[2],
+            ),
+            (-s[1] * c[2] - c[1] * s[2], 0.0, -s[1] * s[2] + c[1] * c[2]),
+        )
+        # Columns of the rotational matrix from wrist center to endeffector (r_ce)
+        r_ce = (
+            (
+                c[3] * c[4] * c[5] - s[3] * s[5],
+                s[3] * c[4] * c[5] + c[3] * s[5],
+                -s[4] * c[5],
+            ),
+            (
+                -c[3] * c[4] * s[5] - s[3] * c[5],
+                -s[3] * c[4] * s[5] + c[3] * c[5],
+                s[4] * s[5],
+            ),
+            (c[3] * s[4], s[3] * s[4], c[4]),
+        )
+        return np.array(
+            [
+                [row[0] * col[0] + row[1] * col[1] + row[2] * col[2] for col in r_ce]
+                for row in r_0c
+            ]
+        )
+
     def inverse_kinematics(self, hom_trans: np.ndarray) -> list[dict[str, float]]:
         """
         DESCRIPTION:
         Compute the inverse kinematics for a 6DOF manipulator with orthoparalel wrist based on a given 4x4 transformation matrix.
+        Solutions of inverse_kinematics_array in dictionary format.
+
+        :param hom_trans: np.array of the homogenous transformation matrix for any given point in "Brandstötter et al." convention
+
+        :return: list of valid solutions as dict {"A{joint}.{solution}": joint angle in robot convention [deg]}; empty list if point is not reachable
+        """
+        solutions = self.inverse_kinematics_array(hom_trans)
+        return [
+            {f"A{i + 1}.{j + 1}": value for i, value in enumerate(solution)}
+            for j, solution in enumerate(solutions.T.tolist())
+        ]
+
+    def inverse_kinematics_array(self, hom_trans: np.ndarray) -> np.ndarray:
+        """
+        DESCRIPTION:
+        Compute the inverse kinematics for a 6DOF manipulator with orthoparalel wrist based on a given 4x4 transformation matrix.
 
         :param hom_trans: np.array of the homogenous transformation matrix for any given point in "Brandstötter et al." convention
 
-        :return: Tuple of two matrices: (solutions in rad, solutions in deg), where each column represents [theta1, theta2, theta3, theta4, theta5, theta6].
+        :return: Array of valid solutions in robot convention [deg] rounded to precision [6xn], where each column represents [A1, A2, A3, A4, A5, A6]; [6x0] if point is not reachable
         """
         # extract coordinates from homogenious transformation matrix
-        x, y, z = hom_trans[0, 3], hom_trans[1, 3], hom_trans[2, 3]
+        x, y, z = hom_trans[:3, 3].tolist()
 
         # Check if coordinates of target point are within robot base
         if not self.validate_self_intersecting(x, y, z):
             print(
                 f"[ERROR] Self-collision detected: Target Position ({x:.2f}, {y:.2f}, {z:.2f}) is inside robot base"
             )
-            return []
+            return np.empty((6, 0))
 
         r0e = hom_trans[:3, :3]
 
         # calculate the position of the wrist center based on given point, tool_offset and orientation of tool
-        tool_offset_robotroot = r0e @ np.array(
-            [self.tool_offset_x, self.tool_offset_y, self.tool_offset_z]
-        )
-        c4_robotroot = self.c4 * r0e @ np.array([0, 0, 1])
-
         # Extract wrist center position from the transformation matrix
-        cx0 = x - tool_offset_robotroot[0] - c4_robotroot[0]
-        cy0 = y - tool_offset_robotroot[1] - c4_robotroot[1]
-        cz0 = z - tool_offset_robotroot[2] - c4_robotroot[2]
+        wrist = hom_trans[:3, 3]
+        if self._has_tool:
+            wrist = wrist - r0e @ self._tool_vec
+        cx0, cy0, cz0 = wrist - self.c4 * r0e[:, 2]
 
         # Extract rotation matrix from the transformation matrix
-        e11, e12, e13 = r0e[0, 0], r0e[0, 1], r0e[0, 2]
-        e21, e22, e23 = r0e[1, 0], r0e[1, 1], r0e[1, 2]
-        e31, e32, e33 = r0e[2, 0], r0e[2, 1], r0e[2, 2]
+        (e11, e12, e13), (e21, e22, e23), (e31, e32, e33) = r0e.tolist()
 
         # A) Calculation of positional part
         # Step 1: Compute intermediate values
-        n_x1 = np.sqrt(cx0**2 + cy0**2 - self.b**2) - self.a1
+        n_x1 = np.sqrt(cx0**2 + cy0**2 - self._b2) - self.a1
         s_12 = n_x1**2 + (cz0 - self.c1) ** 2  # s12 = s1^2
         s_22 = (n_x1 + 2 * self.a1) ** 2 + (cz0 - self.c1) ** 2  # s22 = s2^2
-        k = np.sqrt(self.a2**2 + self.c3**2)
 
-        # Initialize theta matrix with complex values (for unreachable configurations)
-        theta = np.ones((3, 4), dtype=complex) * 1j
+        # Initialize theta matrix (every entry is set below if the wrist center is outside the radius b;
+        # zeros otherwise, as the real part of the former complex initialisation)
+        theta = np.zeros((3, 4))
 
         # Step 2: Check if solutions are real
         # Determines if the Point in the x-y plane is inside the radius described by the offset b around the z axis.
-        # If that's the case, the point is not reachable and the solution is marked as complex.
+        # If that's the case, the point is not reachable and theta stays at its initial values.
         # Changed to: cx0**2 + cy0**2 >= self.b**2 -> before np.isreal(np.sqrt(self.b**2 - (cx0**2 + cy0**2)))
-        if cx0**2 + cy0**2 >= self.b**2:
+        if cx0**2 + cy0**2 >= self._b2:
             # Solve for theta1
 
             # Brandstötter version
@@ -366,108 +421,63 @@ class RobotOPW:
             theta[0, 2] = theta1_2
             theta[0, 3] = theta1_2
 
-            # Solve for theta2
-            value1 = (s_12 + self.c2**2 - k**2) / (2 * np.sqrt(s_12) * self.c2)
+            # Solve for theta2 (acos is calculated once per value for both signs)
+            value1 = (s_12 + self._c2_2 - self._k2) / (2 * np.sqrt(s_12) * self.c2)
             # Checks if value1 is inside the defined domain of acos
             if -1 <= value1 <= 1:
+                acos1 = np.arccos(value1)
                 raw_angle = np.arctan(n_x1 / (cz0 - self.c1))
                 if cz0 - self.c1 < 0:  # atan2 via if clause
                     raw_angle += np.pi
-                theta2_1 = -np.arccos(value1) + raw_angle
-            else:
-                theta2_1 = np.nan
-            if -1 <= value1 <= 1:
-                theta2_2 = +np.acos(value1) + np.atan2(n_x1, (cz0 - self.c1))
+                theta[1, 0] = -acos1 + raw_angle
+                theta[1, 1] = +acos1 + np.atan2(n_x1, (cz0 - self.c1))
             else:
-                theta2_2 = np.nan
-
-            theta[1, 0] = theta2_1
-            theta[1, 1] = theta2_2
-
-            value2 = (s_22 + self.c2**2 - k**2) / (2 * np.sqrt(s_22) * self.c2)
-            if -1 <= value2 <= 1:
-                theta2_3 = -np.acos(value2) - np.atan2(
-                    n_x1 + 2 * self.a1, cz0 - self.c1
-                )
-            else:
-                theta2_3 = np.nan
+                theta[1, 0:2] = np.nan
 
+            value2 = (s_22 + self._c2_2 - self._k2) / (2 * np.sqrt(s_22) * self.c2)
             if -1 <= value2 <= 1:
-                theta2_4 = +np.arccos(value2) - np.atan2(
-                    n_x1 + 2 * self.a1, cz0 - self.c1
-                )
+                acos2 = np.arccos(value2)
+                atan2_2 = np.atan2(n_x1 + 2 * self.a1, cz0 - self.c1)
+                theta[1, 2] = -acos2 - atan2_2
+                theta[1, 3] = +acos2 - atan2_2
             else:
-                theta2_4 = np.nan
-
-            theta[1, 2] = theta2_3
-            theta[1, 3] = theta2_4
+                theta[1, 2:4] = np.nan
 
             # Solve for theta3
-            value3_12 = (s_12 - self.c2**2 - k**2) / (2 * self.c2 * k)
+            value3_12 = (s_12 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
             if -1 <= value3_12 <= 1:
-                theta3_1 = +np.arccos(value3_12) - np.atan2(self.a2, self.c3)
+                acos3_12 = np.arccos(value3_12)
+                theta[2, 0] = +acos3_12 - self._atan2_a2_c3
+                theta[2, 1] = -acos3_12 - self._atan2_a2_c3
             else:
-                theta3_1 = np.nan
-
-            if -1 <= value3_12 <= 1:
-                theta3_2 = -np.arccos(value3_12) - np.atan2(self.a2, self.c3)
-            else:
-                theta3_2 = np.nan
-
-            theta[2, 0] = theta3_1
-            theta[2, 1] = theta3_2
+                theta[2, 0:2] = np.nan
 
             # not duplicated!
-            value3_34 = (s_22 - self.c2**2 - k**2) / (2 * self.c2 * k)
+            value3_34 = (s_22 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
             if -1 <= value3_34 <= 1:
-                theta3_3 = +np.arccos(value3_34) - np.atan2(self.a2, self.c3)
+                acos3_34 = np.arccos(value3_34)
+                theta[2, 2] = +acos3_34 - self._atan2_a2_c3
+                theta[2, 3] = -acos3_34 - self._atan2_a2_c3
             else:
-                theta3_3 = np.nan
-
-            if -1 <= value3_34 <= 1:
-                theta3_4 = -np.arccos(value3_34) - np.atan2(self.a2, self.c3)
-            else:
-                theta3_4 = np.nan
-
-            theta[2, 2] = theta3_3
-            theta[2, 3] = theta3_4
+                theta[2, 2:4] = np.nan
 
         # Step 3: Filter valid solutions (columns with no NaN values)
         valid_columns = ~np.isnan(theta).any(axis=0)
-        filtered_pos_solution_rad = np.real(theta[:, valid_columns])
+        filtered_pos_solution_rad = theta[:, valid_columns]
 
         # B) Calculation of rotational part for filtered solutions of theta1-3
         # Step 1: Calculate orientation for valid solutions in radians
-        final_solutions_rad = []
+        # Two solutions (i and q) for every valid column [2nx6]
+        final_solutions_rad = np.empty((2 * filtered_pos_solution_rad.shape[1], 6))
 
         for j in range(filtered_pos_solution_rad.shape[1]):
-            theta_1, theta_2, theta_3 = filtered_pos_solution_rad[:, j]
-
-            # Calculate the rotational matrix from base to wrist center
-            s1, c1 = np.sin(theta_1), np.cos(theta_1)
-            s2, c2 = np.sin(theta_2), np.cos(theta_2)
-            s3, c3 = np.sin(theta_3), np.cos(theta_3)
-
-            r0c = np.array(
-                [
-                    [c1 * c2 * c3 - c1 * s2 * s3, -s1, c1 * c2 * s3 + c1 * s2 * c3],
-                    [s1 * c2 * c3 - s1 * s2 * s3, c1, s1 * c2 * s3 + s1 * s2 * c3],
-                    [-s2 * c3 - c2 * s3, 0, -s2 * s3 + c2 * c3],
-                ]
-            )
-
-            # Calculate the rotational matrix from wrist center to nullframe / endeffector
-            rce = r0c.T @ r0e
-
-            # Calculate the angels from this rotation matrix
-            # angles = Rotation.to_euler_angles(rce)
-            angles = Rotation.to_euler_angles(rce, "ZYZ")
+            theta_1, theta_2, theta_3 = filtered_pos_solution_rad[:, j].tolist()
 
             # Precompute sinus and cosinus
-            s_1 = np.sin(theta_1)
-            c_1 = np.cos(theta_1)
-            s_23 = np.sin(theta_2 + theta_3)
-            c_23 = np.cos(theta_2 + theta_3)
+            s_1 = math.sin(theta_1)
+            c_1 = math.cos(theta_1)
+            s_23 = math.sin(theta_2 + theta_3)
+            c_23 = math.cos(theta_2 + theta_3)
 
             # Calculate m_i
             m = e13 * s_23 * c_1 + e23 * s_23 * s_1 + e33 * c_23
@@ -478,18 +488,42 @@ class RobotOPW:
 
             # Check if one of the values of Theta 5 is a singularity (theta_5 = 0)
             # 3. Mistake (no valid solution for singularity)
-            if np.isclose(theta_5_i, 0, atol=1e-6) or np.isclose(
-                theta_5_q, 0, atol=1e-6
-            ):
+            if abs(theta_5_i) <= 1e-6 or abs(theta_5_q) <= 1e-6:
 
                 # If Theta 5 = 0 choose alternative way of calculating Theta 4 and 6
                 # Fix Theta 4 = 0 as Axis 4 and 6 are co-linear (Gimbal-lock)
 
                 theta_4_i = 0
                 theta_4_q = 0
+
+                # Calculate the rotational matrix from base to wrist center
+                s2, c2 = math.sin(theta_2), math.cos(theta_2)
+                s3, c3 = math.sin(theta_3), math.cos(theta_3)
+                r0c = np.array(
+                    [
+                        [
+                            c_1 * c2 * c3 - c_1 * s2 * s3,
+                            -s_1,
+                            c_1 * c2 * s3 + c_1 * s2 * c3,
+                        ],
+                        [
+                            s_1 * c2 * c3 - s_1 * s2 * s3,
+                            c_1,
+                            s_1 * c2 * s3 + s_1 * s2 * c3,
+                        ],
+                        [-s2 * c3 - c2 * s3, 0, -s2 * s3 + c2 * c3],
+                    ]
+                )
+
+                # Calculate the rotational matrix from wrist center to nullframe / endeffector
+                rce = r0c.T @ r0e
+
                 # Calculate Theta 6 from the rotational matrix rce
-                theta_6_i = np.deg2rad(angles[0])
-                # alternative: theta_6_i = np.arctan2(rce[1, 0], rce[0, 0])
+                # (first angle of the ZYZ euler angles, as in Rotation.to_euler_angles)
+                if np.sqrt(rce[0, 2] ** 2 + rce[1, 2] ** 2) >= 1e-6:
+                    theta_6_i = np.atan2(rce[1, 2], rce[0, 2])
+                else:
+                    theta_6_i = np.atan2(rce[1, 0], rce[0, 0])
 
                 theta_6_q = theta_6_i - 2 * np.pi
 
@@ -511,11 +545,21 @@ class RobotOPW:
                 theta_6_q = theta_6_i - np.pi
 
             # C) Combine all solutions into the final matrix in radians
-            final_solutions_rad.append(
-                [theta_1, theta_2, theta_3, theta_4_i, theta_5_i, theta_6_i]
+            final_solutions_rad[2 * j] = (
+                theta_1,
+                theta_2,
+                theta_3,
+                theta_4_i,
+                theta_5_i,
+                theta_6_i,
             )
-            final_solutions_rad.append(
-                [theta_1, theta_2, theta_3, theta_4_q, theta_5_q, theta_6_q]
+            final_solutions_rad[2 * j + 1] = (
+                theta_1,
+                theta_2,
+                theta_3,
+                theta_4_q,
+                theta_5_q,
+                theta_6_q,
             )
 
         # D) Convert to degrees
@@ -526,14 +570,11 @@ class RobotOPW:
             print(
                 f"[ERROR] Point ({x:.2f},{y:.2f},{z:.2f}) out of reachable domain of robot"
             )
-            return []
+            return np.empty((6, 0))
 
         # E) Adjust with offset for robot convention
-        final_solutions_corrected = np.column_stack(
-            [
-                self.add_correction(final_solutions_deg[:, i])
-                for i in range(final_solutions_deg.shape[1])
-            ]
+        final_solutions_corrected = (
+            final_solutions_deg * self._sign_col + self._offset_col
         )
 
         # print("final solution corrected")
@@ -548,19 +589,357 @@ class RobotOPW:
             print(
                 f"[ERROR] All possible joint angles for point [{x},{y},{z}] exceed min/max joint angles"
             )
-            return []
+            return np.empty((6, 0))
 
-        # G) Convert solutions into dictionary format with rounding
-        num_solutions = valid_solutions.shape[1]
+        # G) Round solutions to precision
+        return np.round(valid_solutions, self.precision)
 
-        solutions_list = [
-            {
-                f"A{i + 1}.{j + 1}": round(float(valid_solutions[i, j]), self.precision)
-                for i in range(6)
-            }
-            for j in range(num_solutions)
+    def inverse_kinematics_batch(
+        self, hom_trans: np.ndarray
+    ) -> list[list[dict[str, float]]]:
+        """
+        DESCRIPTION:
+        Same as inverse_kinematics, but for many homogenous transformation matrices at once.
+        The positional and rotational part are calculated as array operations over all points;
+        only the conversion into the dictionary format is done per point.
+
+        :param hom_trans: np.array of homogenous transformation matrices [nx4x4] in "Brandstötter et al." convention
+
+        :return: list of valid solutions (as in inverse_kinematics) for every matrix; empty list if point is not reachable
+        """
+        hom_trans = np.asarray(hom_trans, dtype=float).reshape(-1, 4, 4)
+        x, y, z = hom_trans[:, 0, 3], hom_trans[:, 1, 3], hom_trans[:, 2, 3]
+        r0e = hom_trans[:, :3, :3]
+
+        # Target points within robot base (see validate_self_intersecting)
+        inside_base = (x**2 + y**2 <= self.base_r**2) & (0 <= z) & (z <= self.c1)
+
+        # Wrist center position based on given point, tool_offset and orientation of tool
+        wrist = hom_trans[:, :3, 3]
+        if self._has_tool:
+            wrist = wrist - r0e @ self._tool_vec
+        cx0, cy0, cz0 = (wrist - self.c4 * r0e[:, :, 2]).T
+
+        # A) Calculation of positional part (columns as in inverse_kinematics)
+        # Values outside the domain of sqrt / acos turn into NaN and mark the column as not valid
+        with np.errstate(invalid="ignore", divide="ignore"):
+            n_x1 = np.sqrt(cx0**2 + cy0**2 - self._b2) - self.a1
+            s_12 = n_x1**2 + (cz0 - self.c1) ** 2
+            s_22 = (n_x1 + 2 * self.a1) ** 2 + (cz0 - self.c1) ** 2
+
+            theta1_1 = (
+                np.atan2(cy0, cx0) - np.atan2(self.b, n_x1 + self.a1) + np.pi
+            ) % (2 * np.pi) - np.pi
+            theta1_2 = (
+                np.atan2(cy0, cx0) + np.atan2(self.b, n_x1 + self.a1) - np.pi + np.pi
+            ) % (2 * np.pi) - np.pi
+
+            value1 = (s_12 + self._c2_2 - self._k2) / (2 * np.sqrt(s_12) * self.c2)
+            value1 = np.where((-1 <= value1) & (value1 <= 1), value1, np.nan)
+            raw_angle = np.arctan(n_x1 / (cz0 - self.c1))
+            raw_angle = np.where(cz0 - self.c1 < 0, raw_angle + np.pi, raw_angle)
+            acos1 = np.arccos(value1)
+            theta2_1 = -acos1 + raw_angle
+            theta2_2 = +acos1 + np.atan2(n_x1, (cz0 - self.c1))
+
+            value2 = (s_22 + self._c2_2 - self._k2) / (2 * np.sqrt(s_22) * self.c2)
+            value2 = np.where((-1 <= value2) & (value2 <= 1), value2, np.nan)
+            acos2 = np.arccos(value2)
+            atan2_2 = np.atan2(n_x1 + 2 * self.a1, cz0 - self.c1)
+            theta2_3 = -acos2 - atan2_2
+            theta2_4 = +acos2 - atan2_2
+
+            value3_12 = (s_12 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
+            value3_12 = np.where(
+                (-1 <= value3_12) & (value3_12 <= 1), value3_12, np.nan
+            )
+            acos3_12 = np.arccos(value3_12)
+            theta3_1 = +acos3_12 - self._atan2_a2_c3
+            theta3_2 = -acos3_12 - self._atan2_a2_c3
+
+            value3_34 = (s_22 - self._c2_2 - self._k2) / (2 * self.c2 * self._k)
+            value3_34 = np.where(
+                (-1 <= value3_34) & (value3_34 <= 1), value3_34, np.nan
+            )
+            acos3_34 = np.arccos(value3_34)
+            theta3_3 = +acos3_34 - self._atan2_a2_c3
+            theta3_4 = -acos3_34 - self._atan2_a2_c3
+
+        # theta [nx3x4]: rows theta1-3, columns the four positional solutions
+        theta = np.stack(
+            [
+                np.stack([theta1_1, theta1_1, theta1_2, theta1_2], axis=-1),
+                np.stack([theta2_1, theta2_2, theta2_3, theta2_4], axis=-1),
+                np.stack([theta3_1, theta3_2, theta3_3, theta3_4], axis=-1),
+            ],
+            axis=1,
+        )
+        # Wrist center inside the radius b around the z axis: inverse_kinematics keeps the
+        # initial values of theta, which are zero
+        theta[cx0**2 + cy0**2 < self._b2] = 0
+
+        # Step 3: Filter valid solutions (columns with no NaN values) of points outside the robot base
+        valid_columns = ~np.isnan(theta).any(axis=1) & ~inside_base[:, None]
+        point_index, column_index = np.nonzero(valid_columns)
+        theta_1, theta_2, theta_3 = theta[point_index, :, column_index].T
+
+        # B) Calculation of rotational part for filtered solutions of theta1-3
+        e = r0e[point_index]
+        e11, e12, e13 = e[:, 0, 0], e[:, 0, 1], e[:, 0, 2]
+        e21, e22, e23 = e[:, 1, 0], e[:, 1, 1], e[:, 1, 2]
+        e31, e32, e33 = e[:, 2, 0], e[:, 2, 1], e[:, 2, 2]
+
+        s1, c1 = np.sin(theta_1), np.cos(theta_1)
+        s2, c2 = np.sin(theta_2), np.cos(theta_2)
+        s3, c3 = np.sin(theta_3), np.cos(theta_3)
+        zeros = np.zeros_like(theta_1)
+
+        # Rotational matrix from base to wrist center [mx3x3]
+        r0c = np.stack(
+            [
+                np.stack(
+                    [c1 * c2 * c3 - c1 * s2 * s3, -s1, c1 * c2 * s3 + c1 * s2 * c3],
+                    axis=-1,
+                ),
+                np.stack(
+                    [s1 * c2 * c3 - s1 * s2 * s3, c1, s1 * c2 * s3 + s1 * s2 * c3],
+                    axis=-1,
+                ),
+                np.stack([-s2 * c3 - c2 * s3, zeros, -s2 * s3 + c2 * c3], axis=-1),
+            ],
+            axis=1,
+        )
+        # Rotational matrix from wrist center to nullframe / endeffector [mx3x3]
+        rce = np.swapaxes(r0c, 1, 2) @ e
+
+        # First angle of ZYZ euler angles of rce (see Rotation.to_euler_angles)
+        zyz_a = np.where(
+            np.sqrt(rce[:, 0, 2] ** 2 + rce[:, 1, 2] ** 2) >= 1e-6,
+            np.arctan2(rce[:, 1, 2], rce[:, 0, 2]),
+            np.arctan2(rce[:, 1, 0], rce[:, 0, 0]),
+        )
+
+        s_23 = np.sin(theta_2 + theta_3)
+        c_23 = np.cos(theta_2 + theta_3)
+
+        m = e13 * s_23 * c1 + e23 * s_23 * s1 + e33 * c_23
+        theta_5_i = np.atan2(np.sqrt(np.maximum(1 - m**2, 0)), m)
+        theta_5_q = -theta_5_i
+
+        # Singularity (theta_5 = 0): Theta 4 fixed to 0 and Theta 6 calculated from rce
+        singular = np.isclose(theta_5_i, 0, atol=1e-6) | np.isclose(
+            theta_5_q, 0, atol=1e-6
+        )
+        theta_4_i = np.where(
+            singular,
+            0,
+            np.atan2(
+                e23 * c1 - e13 * s1,
+                e13 * c_23 * c1 + e23 * c_23 * s1 - e33 * s_23,
+            ),
+        )
+        theta_4_q = np.where(singular, 0, theta_4_i + np.pi)
+        theta_6_i = np.where(
+            singular,
+            zyz_a,
+            np.atan2(
+                e12 * s_23 * c1 + e22 * s_23 * s1 + e32 * c_23,
+                -e11 * s_23 * c1 - e21 * s_23 * s1 - e31 * c_23,
+            ),
+        )
+        theta_6_q = theta_6_i - np.where(singular, 2 * np.pi, np.pi)
+
+        # C) Combine all solutions [2mx6] (solution i followed by solution q of every column)
+        final_solutions_rad = np.stack(
+            [
+                np.stack(
+                    [theta_1, theta_2, theta_3, theta_4_i, theta_5_i, theta_6_i],
+                    axis=-1,
+                ),
+                np.stack(
+                    [theta_1, theta_2, theta_3, theta_4_q, theta_5_q, theta_6_q],
+                    axis=-1,
+                ),
+            ],
+            axis=1,
+        ).reshape(-1, 6)
+
+        # D) Convert to degrees and E) adjust with offset for robot convention
+        final_solutions_corrected = self.add_correction(np.rad2deg(final_solutions_rad))
+
+        # F) Check if angles are within limits
+        rounded = np.round(final_solutions_corrected, self.precision)
+        within_limits = ((self._lim_lo <= rounded) & (rounded <= self._lim_hi)).all(
+            axis=1
+        )
+
+        # G) Convert rounded solutions into dictionary format (per point)
+        bounds = np.searchsorted(
+            np.repeat(point_index, 2), np.arange(len(hom_trans) + 1)
+        )
+        solution_values = rounded.tolist()
+        solutions = []
+        # error messages are collected and printed at once
+        messages = []
+        for p in range(len(hom_trans)):
+            start, stop = bounds[p], bounds[p + 1]
+            if inside_base[p]:
+                messages.append(
+                    f"[ERROR] Self-collision detected: Target Position ({x[p]:.2f}, {y[p]:.2f}, {z[p]:.2f}) is inside robot base"
+                )
+                solutions.append([])
+            elif start == stop:
+                messages.append(
+                    f"[ERROR] Point ({x[p]:.2f},{y[p]:.2f},{z[p]:.2f}) out of reachable domain of robot"
+                )
+                solutions.append([])
+            elif not within_limits[start:stop].any():
+                messages.append(
+                    f"[ERROR] All possible joint angles for point [{x[p]},{y[p]},{z[p]}] exceed min/max joint angles"
+                )
+                solutions.append([])
+            else:
+                solutions.append(
+                    [
+                        {
+                            f"A{i + 1}.{j + 1}": value
+                            for i, value in enumerate(solution_values[index])
+                        }
+                        for j, index in enumerate(
+                            np.flatnonzero(within_limits[start:stop]) + start
+                        )
+                    ]
+                )
+
+        if messages:
+            print("\n".join(messages))
+
+        return solutions
+
+    def calculate_inverse_kinematics(
+        self,
+        hom_trans: np.ndarray | list[np.ndarray],
+        processes: int = 1,
+        show_progress: bool = False,
+    ) -> list[list[dict[str, float]]]:
+        """
+        DESCRIPTION:
+        Computes the inverse kinematics (see inverse_kinematics) for every given homogenous transformation matrix.
+        Identical matrices (e.g. retract and protract at the position of the previous point) are only solved once.
+        The points are independent of each other, so they can be split onto several worker processes.
+
+        :param hom_trans: homogenous transformation matrices [nx4x4] in "Brandstötter et al." convention
+        :param processes: number of worker processes (1 calculates all points in the current process)
+        :param show_progress: prints the progress in steps of 10%
+
+        :return: list of valid solutions for every matrix (empty list if the point is not reachable)
+        """
+        hom_trans = np.asarray(hom_trans, dtype=float).reshape(-1, 4, 4)
+
+        # Index of every matrix in the unique matrices (in order of first appearance)
+        unique_index = {}
+        inverse = [
+            unique_index.setdefault(matrix.tobytes(), len(unique_index))
+            for matrix in hom_trans
+        ]
+        unique_trans = hom_trans[np.unique(inverse, return_index=True)[1]]
+
+        # Points out of reach get no solution without solving them
+        reachable = self.validate_reach(unique_trans)
+        if not reachable.all():
+            print(
+                "\n".join(
+                    f"[ERROR] Point ({x:.2f},{y:.2f},{z:.2f}) out of reachable domain of robot"
+                    for x, y, z in unique_trans[~reachable, :3, 3].tolist()
+                )
+            )
+        reachable_trans = unique_trans[reachable]
+
+        if processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                solutions = executor.map(
+                    self.inverse_kinematics,
+                    reachable_trans,
+                    chunksize=max(1, len(reachable_trans) // (4 * processes)),
+                )
+                reachable_solutions = self._collect_solutions(
+                    solutions, len(reachable_trans), show_progress
+                )
+        else:
+            # Solved as array operations in chunks (so progress can still be shown)
+            chunks = np.array_split(
+                reachable_trans, max(1, -(-len(reachable_trans) // IK_CHUNK_SIZE))
+            )
+            reachable_solutions = self._collect_solutions(
+                chain.from_iterable(map(self.inverse_kinematics_batch, chunks)),
+                len(reachable_trans),
+                show_progress,
+            )
+
+        unique_solutions = [[] for _ in range(len(unique_trans))]
+        for index, solution in zip(np.flatnonzero(reachable), reachable_solutions):
+            unique_solutions[index] = solution
+
+        # Independent copies for every point, so changing the solutions of one point doesn't change its duplicates
+        return [
+            [dict(solution) for solution in unique_solutions[index]]
+            for index in inverse
         ]
 
+    @staticmethod
+    def solutions_to_array(
+        solutions: list[list[dict[str, float]]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        DESCRIPTION:
+        Converts the solutions of calculate_inverse_kinematics into one array, so all points can be checked at once.
+
+        :param solutions: list of valid solutions for every point (see calculate_inverse_kinematics)
+
+        :return: tuple of joint angles [n x max. number of solutions x 6] (NaN for missing solutions)
+        and bool array if the point is reachable (has at least one solution)
+        """
+        num_solutions = np.fromiter(
+            map(len, solutions), dtype=int, count=len(solutions)
+        )
+        joints = np.full((len(solutions), num_solutions.max(initial=0), 6), np.nan)
+
+        for point_joints, point_solutions in zip(joints, solutions):
+            for solution_joints, solution in zip(point_joints, point_solutions):
+                solution_joints[:] = list(solution.values())
+
+        return joints, num_solutions > 0
+
+    @staticmethod
+    def _collect_solutions(
+        solutions: Iterable[list[dict[str, float]]], total: int, show_progress: bool
+    ) -> list[list[dict[str, float]]]:
+        """
+        DESCRIPTION:
+        Collects the solutions of calculate_inverse_kinematics in order and prints the progress.
+
+        :param solutions: solutions of every point (calculated while iterating)
+        :param total: number of points
+        :param show_progress: prints the progress in steps of 10%
+
+        :return: list of solutions of every point
+        """
+        if not show_progress:
+            return list(solutions)
+
+        solutions_list = []
+        # Start at -10 %, so 0 % is shown as well
+        last_printed_progress = -10
+
+        for index, solution in enumerate(solutions):
+            solutions_list.append(solution)
+
+            progress = int((index + 1) / total * 100)
+            # Display progress every 10%
+            if progress // 10 > last_printed_progress // 10:
+                print(f"Progress: {progress}%")
+                last_printed_progress = progress
+
         return solutions_list
 
 
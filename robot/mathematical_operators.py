@@ -1,3 +1,5 @@
+import math
+from functools import lru_cache
 from typing import List, Tuple, Union
 import numpy as np
 
@@ -20,8 +22,11 @@ class Translation:
 
         :return: 4x4 homogeneous transformation matrix with pure translation
         """
-        matrix = np.eye(4)
-        matrix[:3, 3] = [x, y, z]
+        matrix = np.empty((4, 4))
+        matrix[0] = (1.0, 0.0, 0.0, x)
+        matrix[1] = (0.0, 1.0, 0.0, y)
+        matrix[2] = (0.0, 0.0, 1.0, z)
+        matrix[3] = (0.0, 0.0, 0.0, 1.0)
         return matrix
 
     @staticmethod
@@ -32,8 +37,10 @@ class Translation:
 
         :param matrix: 4x4 homogeneous transformation matrix
         """
-        if matrix.shape != (4, 4):
-            raise ValueError("Input matrix must be 4x4.")
+        # input check (stripped when run with python -O)
+        if __debug__:
+            if matrix.shape != (4, 4):
+                raise ValueError("Input matrix must be 4x4.")
         return matrix[:3, 3]
 
 
@@ -44,6 +51,7 @@ class Rotation:
     """
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def from_euler_angles(
         ax: float, ay: float, az: float, order: str = "ZYX"
     ) -> np.ndarray:
@@ -51,6 +59,7 @@ class Rotation:
         DESCRIPTION:
         Creates a rotation matrix [3x3] from Euler angles (in degrees).
         Supports custom order.
+        Results are cached for repeated angles and therefore returned read-only.
 
         :param ax: rotation in x direction in degrees
         :param ay: rotation in y direction in degrees
@@ -59,24 +68,43 @@ class Rotation:
 
         :return: 3x3 rotation matrix
         """
-        ax, ay, az = np.radians([ax, ay, az])
-
-        # Define basic rotations
-        rx = np.array(
-            [[1, 0, 0], [0, np.cos(ax), -np.sin(ax)], [0, np.sin(ax), np.cos(ax)]]
-        )
-        ry = np.array(
-            [[np.cos(ay), 0, np.sin(ay)], [0, 1, 0], [-np.sin(ay), 0, np.cos(ay)]]
-        )
-        rz = np.array(
-            [[np.cos(az), -np.sin(az), 0], [np.sin(az), np.cos(az), 0], [0, 0, 1]]
-        )
+        ax, ay, az = math.radians(ax), math.radians(ay), math.radians(az)
+        sx, cx = math.sin(ax), math.cos(ax)
+        sy, cy = math.sin(ay), math.cos(ay)
+        sz, cz = math.sin(az), math.cos(az)
 
-        rotations = {"X": rx, "Y": ry, "Z": rz}
-        try:
-            return np.linalg.multi_dot([rotations[axis] for axis in order])
-        except KeyError:
-            raise ValueError(f"Unsupported rotation order: {order}")
+        # Closed form of the products for the common orders
+        if order == "ZYX":
+            # rz @ ry @ rx
+            rotation = np.array(
+                [
+                    [cz * cy, -sz * cx + cz * sy * sx, sz * sx + cz * sy * cx],
+                    [sz * cy, cz * cx + sz * sy * sx, -cz * sx + sz * sy * cx],
+                    [-sy, cy * sx, cy * cx],
+                ]
+            )
+        elif order == "XYZ":
+            # rx @ ry @ rz
+            rotation = np.array(
+                [
+                    [cy * cz, -cy * sz, sy],
+                    [sx * sy * cz + cx * sz, -sx * sy * sz + cx * cz, -sx * cy],
+                    [-cx * sy * cz + sx * sz, cx * sy * sz + sx * cz, cx * cy],
+                ]
+            )
+        else:
+            # Define basic rotations
+            rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]])
+            ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]])
+            rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]])
+
+            rotations = {"X": rx, "Y": ry, "Z": rz}
+            try:
+                rotation = np.linalg.multi_dot([rotations[axis] for axis in order])
+            except KeyError:
+                raise ValueError(f"Unsupported rotation order: {order}")
+        rotation.setflags(write=False)
+        return rotation
 
     @staticmethod
     def to_euler_angles(matrix: np.ndarray, order: str = "ZYX") -> np.ndarray:
@@ -94,52 +122,100 @@ class Rotation:
 
         if order == "ZYX":
             # sy = sqrt(R[0,0]^2 + R[1,0]^2)
-            sy = np.sqrt(matrix[0, 0] ** 2 + matrix[1, 0] ** 2)
+            sy = math.sqrt(matrix[0, 0] ** 2 + matrix[1, 0] ** 2)
             singular = sy < 1e-6
 
             if not singular:
-                a = np.arctan2(matrix[1, 0], matrix[0, 0])
-                b = np.arctan2(-matrix[2, 0], sy)
-                c = np.arctan2(matrix[2, 1], matrix[2, 2])
+                a = math.atan2(matrix[1, 0], matrix[0, 0])
+                b = math.atan2(-matrix[2, 0], sy)
+                c = math.atan2(matrix[2, 1], matrix[2, 2])
             else:
                 # Gimbal lock case
-                a = np.arctan2(-matrix[1, 2], matrix[1, 1])
-                b = np.arctan2(-matrix[2, 0], sy)
+                a = math.atan2(-matrix[1, 2], matrix[1, 1])
+                b = math.atan2(-matrix[2, 0], sy)
                 c = 0
 
         elif order == "XYZ":
             # sy = sqrt(R[0,2]^2 + R[1,2]^2) [length of projection of z axis on xy plane]
-            sy = np.sqrt(matrix[2, 0] ** 2 + matrix[2, 1] ** 2)
+            sy = math.sqrt(matrix[2, 0] ** 2 + matrix[2, 1] ** 2)
             singular = sy < 1e-6
 
             if not singular:
-                a = np.arctan2(matrix[2, 1], matrix[2, 2])
-                b = np.arctan2(
+                a = math.atan2(matrix[2, 1], matrix[2, 2])
+                b = math.atan2(
                     -matrix[2, 0], sy
                 )  # due to unambiguous angle identification not arcsin(-[0,2])
-                c = np.arctan2(matrix[1, 0], matrix[0, 0])
+                c = math.atan2(matrix[1, 0], matrix[0, 0])
             else:
                 # Gimbal lock case
-                a = np.arctan2(-matrix[1, 2], matrix[1, 1])
-                b = np.arctan2(-matrix[2, 0], sy)
+                a = math.atan2(-matrix[1, 2], matrix[1, 1])
+                b = math.atan2(-matrix[2, 0], sy)
                 c = 0
 
         elif order == "ZYZ":
-            sy = np.sqrt(matrix[0, 2] ** 2 + matrix[1, 2] ** 2)
+            sy = math.sqrt(matrix[0, 2] ** 2 + matrix[1, 2] ** 2)
             singular = sy < 1e-6
             if not singular:
-                a = np.arctan2(matrix[1, 2], matrix[0, 2])
-                b = np.arctan2(sy, matrix[2, 2])
-                c = np.arctan2(matrix[2, 1], -matrix[2, 0])
+                a = math.atan2(matrix[1, 2], matrix[0, 2])
+                b = math.atan2(sy, matrix[2, 2])
+                c = math.atan2(matrix[2, 1], -matrix[2, 0])
             else:
 
-                a = np.arctan2(matrix[1, 0], matrix[0, 0])
-                b = np.arctan2(sy, matrix[2, 2])
+                a = math.atan2(matrix[1, 0], matrix[0, 0])
+                b = math.atan2(sy, matrix[2, 2])
                 c = 0
         else:
             raise ValueError(f"Unsupported rotation order: {order}")
 
-        return np.degrees([a, b, c])
+        return np.array((math.degrees(a), math.degrees(b), math.degrees(c)))
+
+    @staticmethod
+    def to_euler_angles_batch(matrices: np.ndarray, order: str = "ZYX") -> np.ndarray:
+        """
+        DESCRIPTION:
+        Extracts Euler angles from many rotation matrices at once (same convention as to_euler_angles).
+        The gimbal lock case is selected per matrix with np.where instead of a branch.
+
+        :param matrices: rotation matrices [nx3x3]
+        :param order: rotation order (only XYZ, ZYX, ZYZ possible)
+
+        :return: angles in degree [nx3]
+        """
+        m = np.asarray(matrices, dtype=float).reshape(-1, 3, 3)
+
+        # a: (regular, gimbal lock) case; c is 0 in gimbal lock case
+        if order == "ZYX":
+            sy = np.sqrt(m[:, 0, 0] ** 2 + m[:, 1, 0] ** 2)
+            a = (
+                np.arctan2(m[:, 1, 0], m[:, 0, 0]),
+                np.arctan2(-m[:, 1, 2], m[:, 1, 1]),
+            )
+            b = np.arctan2(-m[:, 2, 0], sy)
+            c = np.arctan2(m[:, 2, 1], m[:, 2, 2])
+        elif order == "XYZ":
+            sy = np.sqrt(m[:, 2, 0] ** 2 + m[:, 2, 1] ** 2)
+            a = (
+                np.arctan2(m[:, 2, 1], m[:, 2, 2]),
+                np.arctan2(-m[:, 1, 2], m[:, 1, 1]),
+            )
+            b = np.arctan2(-m[:, 2, 0], sy)
+            c = np.arctan2(m[:, 1, 0], m[:, 0, 0])
+        elif order == "ZYZ":
+            sy = np.sqrt(m[:, 0, 2] ** 2 + m[:, 1, 2] ** 2)
+            a = (
+                np.arctan2(m[:, 1, 2], m[:, 0, 2]),
+                np.arctan2(m[:, 1, 0], m[:, 0, 0]),
+            )
+            b = np.arctan2(sy, m[:, 2, 2])
+            c = np.arctan2(m[:, 2, 1], -m[:, 2, 0])
+        else:
+            raise ValueError(f"Unsupported rotation order: {order}")
+
+        singular = sy < 1e-6
+        angles = np.stack(
+            [np.where(singular, a[1], a[0]), b, np.where(singular, 0.0, c)], axis=-1
+        )
+        return np.degrees(angles)
 
 
 class Transformation:
@@ -165,9 +241,10 @@ class Transformation:
             raise ValueError("Rotation must be a 3x3 matrix.")
         if len(translation) != 3:
             raise ValueError("Translation must be a 3-element vector.")
-        matrix = np.eye(4)
+        matrix = np.empty((4, 4))
         matrix[:3, :3] = rotation
         matrix[:3, 3] = translation
+        matrix[3] = (0.0, 0.0, 0.0, 1.0)
         return matrix
 
     @staticmethod
@@ -182,8 +259,10 @@ class Transformation:
 
         :return: tupel of 3x3 rotation matrix and 3x1 translation vector
         """
-        if matrix.shape != (4, 4):
-            raise ValueError("Input matrix must be 4x4.")
+        # input check (stripped when run with python -O)
+        if __debug__:
+            if matrix.shape != (4, 4):
+                raise ValueError("Input matrix must be 4x4.")
         rotation = matrix[:3, :3]
         translation = matrix[:3, 3]
         return rotation, translation
@@ -198,14 +277,17 @@ class Transformation:
 
         :return: inverted 4x4 homogeneous transformation matrix
         """
-        if matrix.shape != (4, 4):
-            raise ValueError("Input matrix must be 4x4.")
-        rotation = matrix[:3, :3]
-        translation = matrix[:3, 3]
-
-        inverted = np.eye(4)
-        inverted[:3, :3] = rotation.T
-        inverted[:3, 3] = -rotation.T @ translation
+        # input check (stripped when run with python -O)
+        if __debug__:
+            if matrix.shape != (4, 4):
+                raise ValueError("Input matrix must be 4x4.")
+        rotation_t = matrix[:3, :3].T
+
+        # Closed form of the affine inverse: [R.T, -R.T @ t; 0, 0, 0, 1]
+        inverted = np.empty((4, 4))
+        inverted[:3, :3] = rotation_t
+        inverted[:3, 3] = -(rotation_t @ matrix[:3, 3])
+        inverted[3] = (0.0, 0.0, 0.0, 1.0)
         return inverted
 
     @staticmethod
@@ -219,11 +301,36 @@ class Transformation:
 
         :return: transformed 3x1 vector or point
         """
-        if len(point) != 3:
-            raise ValueError("Point must be a 3-element vector.")
-        point_homogeneous = np.append(point, 1.0)
-        transformed = matrix @ point_homogeneous
-        return transformed[:3]
+        # input check (stripped when run with python -O)
+        if __debug__:
+            if len(point) != 3:
+                raise ValueError("Point must be a 3-element vector.")
+        # rotation and translation part directly (bottom row of an affine transformation is [0, 0, 0, 1])
+        return matrix[:3, :3] @ np.asarray(point, dtype=float) + matrix[:3, 3]
+
+    @staticmethod
+    def apply_many(
+        matrix: np.ndarray, points: np.ndarray, dtype: np.dtype | type = np.float64
+    ) -> np.ndarray:
+        """
+        DESCRIPTION:
+        Applies a transformation matrix to many points at once (one matrix product for all points).
+        Only the rotation and translation part are used, as the bottom row of an affine transformation is [0, 0, 0, 1].
+
+        :param matrix: 4x4 homogeneous transformation matrix
+        :param points: points [nx3] or a single point [3]
+        :param dtype: floating point type of the calculation (np.float32 halves the memory of large point clouds)
+
+        :return: transformed points [nx3] (or [3] for a single point) of type dtype
+        """
+        if matrix.shape != (4, 4):
+            raise ValueError("Input matrix must be 4x4.")
+        points = np.asarray(points, dtype=dtype)
+        single_point = points.ndim == 1
+        matrix = np.asarray(matrix, dtype=dtype)
+        transformed = points.reshape(-1, 3) @ matrix[:3, :3].T
+        transformed += matrix[:3, 3]
+        return transformed[0] if single_point else transformed
 
 
 if __name__ == "__main__":
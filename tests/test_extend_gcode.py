@@ -0,0 +1,98 @@
+from rhino.process.extend_gcode import (
+    add_point_info,
+    add_point_info_array,
+    points_to_array,
+    array_to_points,
+)
+
+
+def make_point(move, line_type, layer, x):
+    return {
+        "Move": move,
+        "X": x,
+        "Y": 0.0,
+        "Z": 0.0,
+        "E_Rel": 0,
+        "Layer": layer,
+        "Type": line_type,
+        "Layer_Height": 15.0,
+        "Reachable": True,
+        "Linewidth": 0,
+        "Flow": 0,
+        "RPM": 0,
+        "Voltage": 0,
+        "Vel_CP_Max": 0.35,
+    }
+
+
+def test_add_point_info():
+    # Two layers with type changes in between travel, printed types and retract
+    points = [
+        make_point("G0", "travel", 0, 0.0),
+        make_point("G1", "wall_outer", 0, 1.0),
+        make_point("G1", "wall_outer", 0, 2.0),
+        make_point("G1", "infill", 0, 3.0),
+        make_point("G0", "retract", 0, 3.0),
+        make_point("G0", "travel", 0, 4.0),
+        make_point("G0", "travel", 1, 5.0),
+        make_point("G1", "wall_outer", 1, 6.0),
+    ]
+    result = add_point_info(points)
+
+    # Transition points are inserted for travel -> wall_outer, wall_outer -> infill and travel -> wall_outer
+    expected = [
+        (0.0, "travel", 0, 0, 0, "beginning"),
+        (0.0, "wall_outer", 0, 1, 0, "start"),
+        (1.0, "wall_outer", 0, 1, 1, "1"),
+        (2.0, "wall_outer", 0, 1, 2, "stop"),
+        (2.0, "infill", 0, 2, 0, "start"),
+        (3.0, "infill", 0, 2, 1, "stop"),
+        (3.0, "retract", 0, 3, 0, "retract"),
+        (4.0, "travel", 0, 3, 1, "0"),
+        (5.0, "travel", 1, 0, 0, "0"),
+        (5.0, "wall_outer", 1, 1, 0, "start"),
+        (6.0, "wall_outer", 1, 1, 1, "end"),
+    ]
+    assert [
+        (p["X"], p["Type"], p["Layer"], p["Line"], p["Point"], p["Point_Info"])
+        for p in result
+    ] == expected
+
+    # Counters stay plain python integers
+    assert all(type(p["Line"]) is int and type(p["Point"]) is int for p in result)
+
+
+def test_add_point_info_array():
+    points = [
+        make_point("G0", "travel", 0, 0.0),
+        make_point("G1", "wall_outer", 0, 1.0),
+        make_point("G1", "infill", 0, 2.0),
+        make_point("G0", "retract", 0, 2.0),
+    ]
+    array = add_point_info_array(points_to_array(points))
+    assert array_to_points(array) == [
+        {key: point.get(key, point.get("E_rel")) for key in array.dtype.names}
+        for point in add_point_info(points)
+    ]
+
+
+def test_add_point_info_empty():
+    assert add_point_info([]) == []
+
+
+def test_point_array_round_trip():
+    # Transition points store "E_rel", the array keeps it as "E_Rel"
+    points = add_point_info(
+        [
+            make_point("G0", "travel", 0, 0.0),
+            make_point("G1", "wall_outer", 0, 1.0),
+        ]
+    )
+    array = points_to_array(points)
+    assert array["Type"].tolist() == ["travel", "wall_outer", "wall_outer"]
+
+    round_trip = array_to_points(array)
+    for point, result in zip(points, round_trip):
+        for key, value in result.items():
+            expected = point.get(key, point.get("E_rel"))
+            assert value == expected
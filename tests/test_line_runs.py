@@ -0,0 +1,116 @@
+import numpy as np
+
+from rhino.process.line_runs import (
+    get_columns,
+    get_line_runs,
+    get_segment_runs,
+    zero_pad_id,
+)
+
+LINETYPES = {"travel": "Dashed", "wall_outer": "Continuous"}
+LINE_WIDTHS = {"dashed": 0.3, "continuous": 0.5}
+
+
+def make_point(layer, line, line_type="wall_outer", move="G1", linewidth=10.0):
+    return {
+        "X": 0.0,
+        "Y": 0.0,
+        "Z": 0.0,
+        "Layer": layer,
+        "Line": line,
+        "Type": line_type,
+        "Move": move,
+        "Point_Info": "1",
+        "Linewidth": linewidth,
+        "Flow": 1.0,
+        "RPM": 2.0,
+        "Voltage": 3.0,
+        "Vel_CP_Max": 0.35,
+    }
+
+
+def test_get_columns():
+    points = [make_point(0, 1), make_point(2, 3)]
+    assert get_columns(points, ("Layer", "Line")) == [(0, 2), (1, 3)]
+
+    # Structured array gives the same columns
+    array = np.array([(0, 1), (2, 3)], dtype=[("Layer", "i4"), ("Line", "i4")])
+    assert get_columns(array, ("Layer", "Line")) == [[0, 2], [1, 3]]
+
+    # No points
+    assert get_columns([], ("Layer", "Line")) == [[], []]
+
+
+def test_zero_pad_id():
+    assert zero_pad_id(0) == "0000"
+    assert zero_pad_id(12) == "0012"
+    assert zero_pad_id(12345) == "12345"
+
+
+def test_get_line_runs():
+    assert get_line_runs([], []) == []
+    assert get_line_runs([0], [0]) == [(0, 1)]
+
+    # Change in Line, single point run and change in Layer with the same Line
+    layers = [0, 0, 0, 0, 1, 1]
+    lines = [0, 0, 1, 2, 2, 2]
+    assert get_line_runs(layers, lines) == [(0, 2), (2, 3), (3, 4), (4, 6)]
+
+
+def test_get_segment_runs_empty():
+    assert get_segment_runs([], LINETYPES, LINE_WIDTHS, 3) == []
+    # Single points have no segments
+    points = [make_point(0, 0), make_point(0, 1), make_point(1, 1)]
+    assert get_segment_runs(points, LINETYPES, LINE_WIDTHS, 3) == []
+
+
+def test_get_segment_runs_merge():
+    points = [
+        make_point(0, 1),
+        make_point(0, 1),
+        make_point(0, 1),
+        make_point(0, 1),
+        # Different attributes start a new run
+        make_point(0, 1, linewidth=12.0),
+        make_point(0, 1, linewidth=12.0),
+    ]
+    runs = get_segment_runs(points, LINETYPES, LINE_WIDTHS, 3)
+    assert [run[:4] for run in runs] == [(0, 4, 0, 2), (3, 6, 3, 4)]
+
+    forced_type, visual_type, user_strings, plot_weight = runs[0][4]
+    assert (forced_type, visual_type, plot_weight) == ("wall_outer", "wall_outer", 10.0)
+    assert dict(user_strings)["Layer"] == "0000"
+    assert dict(user_strings)["Line"] == "0001"
+    assert runs[1][4][3] == 12.0
+
+
+def test_get_segment_runs_types():
+    points = [
+        make_point(0, 0, "travel", "G0"),
+        make_point(0, 0, "retract", "G0"),
+        make_point(0, 0, "protract", "G0"),
+        make_point(0, 0, "wall_outer"),
+    ]
+    runs = get_segment_runs(points, LINETYPES, LINE_WIDTHS, 3)
+
+    # Blocked transitions are travel, protract -> wall_outer keeps its type
+    assert [run[:4] for run in runs] == [(0, 3, 0, 1), (2, 4, 2, 2)]
+    assert runs[0][4][:2] == ("travel", "travel")
+    assert runs[0][4][3] == 0.3
+    assert runs[1][4][:2] == ("wall_outer", "wall_outer")
+
+
+def test_get_segment_runs_numbering():
+    points = [
+        make_point(0, 0),
+        make_point(0, 0),
+        make_point(0, 0),
+        # Segment numbers restart for every Layer/Line; the single point of Line 1 has no segment
+        make_point(0, 1),
+        make_point(0, 2),
+        make_point(0, 2),
+        make_point(1, 2),
+        make_point(1, 2),
+    ]
+    runs = get_segment_runs(points, LINETYPES, LINE_WIDTHS, 3)
+    assert [run[:4] for run in runs] == [(0, 3, 0, 1), (4, 6, 0, 0), (6, 8, 0, 0)]
@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+from robot.kinematics import RobotOPW
+from robot.mathematical_operators import Rotation, Transformation
+
+
+def make_robot(tool_offset: dict | None = None, base_radius: float = 300):
+    # Small robot with the geometry of tests.test_kinematics (and a robot base)
+    return RobotOPW(
+        robot_id="TestRobot",
+        robot_geometry={
+            "a1": 500,
+            "a2": 55,
+            "b": 0,
+            "c1": 1045,
+            "c2": 1300,
+            "c3": 1525,
+            "c4": 290,
+        },
+        robot_base_radius=base_radius,
+        robot_rotation_sign={
+            "A1": False,
+            "A2": True,
+            "A3": True,
+            "A4": False,
+            "A5": True,
+            "A6": False,
+        },
+        robot_rotation_limit={
+            "A1": [-185, 185],
+            "A2": [-130, 20],
+            "A3": [-100, 140],
+            "A4": [-350, 350],
+            "A5": [-120, 120],
+            "A6": [-350, 350],
+        },
+        robot_rotation_offset={"A1": 0, "A2": -90, "A3": 0, "A4": 0, "A5": 0, "A6": 0},
+        robot_tool_offset=tool_offset or {"X": 0, "Y": 0, "Z": 0},
+    )
+
+
+def pose_from_joints(robot: RobotOPW, joints: list[float]) -> np.ndarray:
+    # Pose of given joint angles (robot convention) by forward kinematics
+    matrix, reachable = robot.forward_kinematics(
+        {f"A{i + 1}": value for i, value in enumerate(joints)}
+    )
+    assert reachable
+    return matrix
+
+
+def make_poses(robot: RobotOPW) -> dict[str, np.ndarray]:
+    # Reachable pose, pose out of reach, pose inside the robot base and pose at the wrist singularity (A5 = 0)
+    return {
+        "reachable": pose_from_joints(robot, [10, -80, 100, 20, 45, -30]),
+        "out_of_reach": Transformation.from_rotation_and_translation(
+            Rotation.from_euler_angles(0, 180, 0), [5000.0, 0.0, 500.0]
+        ),
+        "inside_base": Transformation.from_rotation_and_translation(
+            Rotation.from_euler_angles(0, 180, 0), [100.0, 50.0, 500.0]
+        ),
+        "singular": pose_from_joints(robot, [-25, -60, 80, 15, 0, 40]),
+    }
+
+
+@pytest.mark.parametrize(
+    "tool_offset", [None, {"X": 20.0, "Y": -15.0, "Z": 150.0}], ids=["no_tool", "tool"]
+)
+def test_inverse_kinematics_batch(tool_offset):
+    # Batched inverse kinematics equals the inverse kinematics of every single pose
+    robot = make_robot(tool_offset)
+    poses = make_poses(robot)
+    batch = robot.inverse_kinematics_batch(np.array(list(poses.values())))
+    expected = [robot.inverse_kinematics(pose) for pose in poses.values()]
+    assert batch == expected
+
+    solutions = dict(zip(poses, batch))
+    assert solutions["reachable"] and solutions["singular"]
+    assert solutions["out_of_reach"] == [] and solutions["inside_base"] == []
+
+
+def test_inverse_kinematics_batch_solves_pose():
+    # Every solution of the batch leads back to the given pose
+    robot = make_robot({"X": 20.0, "Y": -15.0, "Z": 150.0})
+    pose = make_poses(robot)["reachable"]
+    (solutions,) = robot.inverse_kinematics_batch(pose[None])
+    for solution in solutions:
+        joints = [value for value in solution.values()]
+        np.testing.assert_array_almost_equal(
+            pose_from_joints(robot, joints), pose, decimal=3
+        )
+
+
+def test_inverse_kinematics_batch_empty():
+    assert make_robot().inverse_kinematics_batch(np.empty((0, 4, 4))) == []
+
+
+def test_calculate_inverse_kinematics():
+    robot = make_robot()
+    poses = make_poses(robot)
+    # Retract / protract repeat the pose of the previous point
+    hom_trans = np.array(
+        [
+            poses["reachable"],
+            poses["out_of_reach"],
+            poses["reachable"],
+            poses["singular"],
+            poses["reachable"],
+            poses["inside_base"],
+        ]
+    )
+    solutions = robot.calculate_inverse_kinematics(hom_trans)
+    assert solutions == [robot.inverse_kinematics(matrix) for matrix in hom_trans]
+
+    # Repeated poses get independent copies of the same solutions
+    assert solutions[0] == solutions[2] == solutions[4]
+    assert solutions[0] is not solutions[2]
+    solutions[2].pop()
+    solutions[4][0]["A1.1"] += 1
+    assert solutions[0] == robot.inverse_kinematics(hom_trans[0])
+    assert solutions[0] and solutions[3]
+
+    # Poses out of reach or inside the robot base have no solution
+    assert solutions[1] == [] and solutions[5] == []
+
+
+def test_calculate_inverse_kinematics_processes():
+    # Solving in worker processes gives the same result as solving in the current process
+    robot = make_robot({"X": 20.0, "Y": -15.0, "Z": 150.0})
+    hom_trans = np.array(list(make_poses(robot).values()) * 3)
+    assert robot.calculate_inverse_kinematics(
+        hom_trans, processes=2
+    ) == robot.calculate_inverse_kinematics(hom_trans, processes=1)
+
+
+def test_validate_reach():
+    robot = make_robot()
+    poses = make_poses(robot)
+    reach = robot.validate_reach(np.array(list(poses.values())))
+    # Only the point out of reach is rejected (points inside the base are left to the inverse kinematics)
+    np.testing.assert_array_equal(reach, [True, False, True, True])
+
+
+def test_solutions_to_array():
+    solutions = [
+        [
+            {f"A{i + 1}.1": float(i) for i in range(6)},
+            {f"A{i + 1}.2": float(10 + i) for i in range(6)},
+        ],
+        [],
+        [{f"A{i + 1}.1": float(20 + i) for i in range(6)}],
+    ]
+    joints, reachable = RobotOPW.solutions_to_array(solutions)
+
+    # Points are padded with NaN up to the maximum number of solutions
+    assert joints.shape == (3, 2, 6)
+    np.testing.assert_array_equal(joints[0], [np.arange(6), np.arange(10, 16)])
+    assert np.isnan(joints[1]).all()
+    np.testing.assert_array_equal(joints[2, 0], np.arange(20, 26))
+    assert np.isnan(joints[2, 1]).all()
+    np.testing.assert_array_equal(reachable, [True, False, True])
+
+    # No points
+    joints, reachable = RobotOPW.solutions_to_array([])
+    assert joints.shape == (0, 0, 6) and reachable.shape == (0,)
@@ -71,3 +71,85 @@ def test_inversion():
     transformed_point = Transformation.apply(inverted_matrix, point)
     expected_point = np.array([0, 0, 1.0])
     np.testing.assert_array_almost_equal(transformed_point, expected_point, decimal=6)
+
+
+def test_apply_many():
+    # Applying a transformation to many points equals applying it to every point
+    transformation_matrix = Transformation.from_rotation_and_translation(
+        Rotation.from_euler_angles(30, -45, 120), [5.0, -2.0, 7.5]
+    )
+    points = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, -3.0], [4.5, -1.0, 10.0]])
+    transformed_points = Transformation.apply_many(transformation_matrix, points)
+    expected_points = np.array(
+        [Transformation.apply(transformation_matrix, point) for point in points]
+    )
+    np.testing.assert_array_almost_equal(transformed_points, expected_points, decimal=9)
+
+    # A single point keeps its shape
+    transformed_point = Transformation.apply_many(transformation_matrix, points[0])
+    assert transformed_point.shape == (3,)
+    np.testing.assert_array_almost_equal(
+        transformed_point, expected_points[0], decimal=9
+    )
+    transformed_point_32 = Transformation.apply_many(
+        transformation_matrix, points[0], dtype=np.float32
+    )
+    assert transformed_point_32.shape == (3,)
+    assert transformed_point_32.dtype == np.float32
+    np.testing.assert_array_almost_equal(
+        transformed_point_32, expected_points[0], decimal=4
+    )
+
+    # Calculation in single precision
+    transformed_points_32 = Transformation.apply_many(
+        transformation_matrix, points, dtype=np.float32
+    )
+    assert transformed_points_32.dtype == np.float32
+    np.testing.assert_array_almost_equal(
+        transformed_points_32, expected_points, decimal=4
+    )
+
+
+def test_from_euler_angles_cached():
+    # Repeated angles return the same read-only rotation matrix
+    rotation_matrix = Rotation.from_euler_angles(10, 20, 30)
+    assert Rotation.from_euler_angles(10, 20, 30) is rotation_matrix
+    assert not rotation_matrix.flags.writeable
+
+
+def test_from_euler_angles_closed_form():
+    # Closed form for "ZYX" and "XYZ" equals the product of the basic rotations
+    ax, ay, az = np.radians([25.0, -60.0, 145.0])
+    rx = np.array(
+        [[1, 0, 0], [0, np.cos(ax), -np.sin(ax)], [0, np.sin(ax), np.cos(ax)]]
+    )
+    ry = np.array(
+        [[np.cos(ay), 0, np.sin(ay)], [0, 1, 0], [-np.sin(ay), 0, np.cos(ay)]]
+    )
+    rz = np.array(
+        [[np.cos(az), -np.sin(az), 0], [np.sin(az), np.cos(az), 0], [0, 0, 1]]
+    )
+    np.testing.assert_array_almost_equal(
+        Rotation.from_euler_angles(25.0, -60.0, 145.0, order="ZYX"), rz @ ry @ rx
+    )
+    np.testing.assert_array_almost_equal(
+        Rotation.from_euler_angles(25.0, -60.0, 145.0, order="XYZ"), rx @ ry @ rz
+    )
+    np.testing.assert_array_almost_equal(
+        Rotation.from_euler_angles(25.0, -60.0, 145.0, order="YXZ"), ry @ rx @ rz
+    )
+
+
+def test_to_euler_angles_batch():
+    # Batched extraction equals extraction per matrix (including gimbal lock)
+    matrices = [
+        Rotation.from_euler_angles(ax, ay, az, order=order)
+        for ax, ay, az in [(10, 20, 30), (-45, 90, 60), (170, -35, -120), (0, 0, 0)]
+        for order in ("ZYX", "XYZ")
+    ]
+    for order in ("ZYX", "XYZ", "ZYZ"):
+        angles = Rotation.to_euler_angles_batch(np.array(matrices), order=order)
+        expected_angles = np.array(
+            [Rotation.to_euler_angles(matrix, order=order) for matrix in matrices]
+        )
+        np.testing.assert_array_almost_equal(angles, expected_angles, decimal=9)